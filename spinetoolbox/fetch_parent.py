@@ -106,6 +106,16 @@ class FetchParent(QObject):
         self._items_to_add.setdefault(db_map, []).append(item)
         self._changes_pending.emit()
 
+    def add_items(self, db_map, items):
+        """Adds several items at once, signalling pending changes only once.
+
+        Args:
+            db_map (DiffDatabaseMapping): database mapping
+            items (list): items to add
+        """
+        self._items_to_add.setdefault(db_map, []).extend(items)
+        self._changes_pending.emit()
+
     def update_item(self, db_map, item):
         self._items_to_update.setdefault(db_map, []).append(item)
         self._changes_pending.emit()
@@ -17,6 +17,7 @@ General helper functions and classes.
 """
 
 from enum import Enum, unique
+import functools
 import itertools
 import os
 import glob
@@ -30,6 +31,8 @@ import pathlib
 import bisect
 from contextlib import contextmanager
 import matplotlib
+from pygments.lexers import get_lexer_by_name
+from pygments.styles import get_style_by_name
 from PySide2.QtCore import Qt, Slot, QFile, QIODevice, QSize, QRect, QPoint, QUrl, QObject, QEvent
 from PySide2.QtCore import __version__ as qt_version
 from PySide2.QtCore import __version_info__ as qt_version_info
@@ -401,7 +404,9 @@ def format_string_list(str_list):
     Returns:
         str: formatted list
     """
-    return "<ul>" + "".join(["<li>" + str(x) + "</li>" for x in str_list]) + "</ul>"
+    if not str_list:
+        return "<ul></ul>"
+    return "<ul><li>" + "</li><li>".join(map(str, str_list)) + "</li></ul>"
 
 
 def rows_to_row_count_tuples(rows):
@@ -1283,6 +1288,65 @@ def signal_waiter(signal, condition=None):
         waiter.deleteLater()
 
 
+@functools.lru_cache(maxsize=None)
+def lexer_by_name(name):
+    """Returns a Pygments lexer for given alias.
+
+    Lexers are looked up only once per alias and shared between highlighters.
+
+    Args:
+        name (str): lexer alias, e.g. "python"
+
+    Returns:
+        Lexer: lexer instance
+
+    Raises:
+        ClassNotFound: if no lexer exists for the alias
+    """
+    return get_lexer_by_name(name)
+
+
+@functools.lru_cache(maxsize=None)
+def style_by_name(name):
+    """Returns a Pygments style class, looking it up only once per name.
+
+    Args:
+        name (str): style name, e.g. "monokai"
+
+    Returns:
+        type: style class
+    """
+    return get_style_by_name(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _style_formats(style):
+    """Builds text formats for Pygments style's token types.
+
+    Args:
+        style (type): Pygments style class
+
+    Returns:
+        dict: mapping from token type to QTextCharFormat
+    """
+    formats = {}
+    for ttype, tstyle in style:
+        text_format = formats[ttype] = QTextCharFormat()
+        if tstyle['color']:
+            brush = QBrush(QColor("#" + tstyle['color']))
+            text_format.setForeground(brush)
+        if tstyle['bgcolor']:
+            brush = QBrush(QColor("#" + tstyle['bgcolor']))
+            text_format.setBackground(brush)
+        if tstyle['bold']:
+            text_format.setFontWeight(QFont.Bold)
+        if tstyle['italic']:
+            text_format.setFontItalic(True)
+        if tstyle['underline']:
+            text_format.setFontUnderline(True)
+    return formats
+
+
 class CustomSyntaxHighlighter(QSyntaxHighlighter):
     def __init__(self, *arg, **kwargs):
         super().__init__(*arg, **kwargs)
@@ -1294,32 +1358,33 @@ class CustomSyntaxHighlighter(QSyntaxHighlighter):
         return self._formats
 
     def set_style(self, style):
-        self._formats.clear()
-        for ttype, tstyle in style:
-            text_format = self._formats[ttype] = QTextCharFormat()
-            if tstyle['color']:
-                brush = QBrush(QColor("#" + tstyle['color']))
-                text_format.setForeground(brush)
-            if tstyle['bgcolor']:
-                brush = QBrush(QColor("#" + tstyle['bgcolor']))
-                text_format.setBackground(brush)
-            if tstyle['bold']:
-                text_format.setFontWeight(QFont.Bold)
-            if tstyle['italic']:
-                text_format.setFontItalic(True)
-            if tstyle['underline']:
-                text_format.setFontUnderline(True)
+        self._formats = dict(_style_formats(style))
 
     def yield_formats(self, text):
         if self.lexer is None:
             return ()
+        formats = self._formats
+        run_start = run_count = 0
+        run_format = None
         for start, ttype, subtext in self.lexer.get_tokens_unprocessed(text):
-            while True:
-                text_format = self._formats.get(ttype)
-                if text_format is not None:
-                    break
-                ttype = ttype.parent
-            yield start, len(subtext), text_format
+            text_format = formats.get(ttype)
+            if text_format is None:
+                parent = ttype.parent
+                while True:
+                    text_format = formats.get(parent)
+                    if text_format is not None:
+                        break
+                    parent = parent.parent
+                # Remember the inherited format so the next token of this type is a single lookup.
+                formats[ttype] = text_format
+            if text_format is run_format:
+                run_count += len(subtext)
+                continue
+            if run_format is not None:
+                yield run_start, run_count, run_format
+            run_start, run_count, run_format = start, len(subtext), text_format
+        if run_format is not None:
+            yield run_start, run_count, run_format
 
     def highlightBlock(self, text):
         for start, count, text_format in self.yield_formats(text):
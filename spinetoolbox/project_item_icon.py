@@ -52,6 +52,7 @@ class ProjectItemIcon(QGraphicsPathItem):
 
     ITEM_EXTENT = 64
     FONT_SIZE_PIXELS = 12  # pixel size to prevent font scaling by system
+    animation_signaller = None  # animated icons replace this with an object that has animation_started/stopped signals
 
     def __init__(self, toolbox, icon_file, icon_color):
         """
@@ -563,6 +564,10 @@ class ExecutionIcon(QGraphicsEllipseItem):
     _CROSS = "\uf00d"  # Fail
     _CLOCK = "\uf017"  # Waiting
     _SKIP = "\uf054"  # Excluded
+    _ORANGE = QColor("orange")
+    _GREEN = QColor("green")
+    _CHOCOLATE = QColor("chocolate")
+    _RED = QColor("red")
 
     def __init__(self, parent):
         """
@@ -572,6 +577,8 @@ class ExecutionIcon(QGraphicsEllipseItem):
         super().__init__(parent)
         self._parent = parent
         self._execution_state = "not started"
+        self._glyph = None
+        self._glyph_color = None
         self._text_item = QGraphicsTextItem(self)
         font = QFont('Font Awesome 5 Free Solid')
         self._text_item.setFont(font)
@@ -590,6 +597,11 @@ class ExecutionIcon(QGraphicsEllipseItem):
         return self._parent.name()
 
     def _repaint(self, text, color):
+        if text == self._glyph and color == self._glyph_color:
+            self.show()
+            return
+        self._glyph = text
+        self._glyph_color = color
         self._text_item.prepareGeometryChange()
         self._text_item.setPos(0, 0)
         self._text_item.setPlainText(text)
@@ -603,25 +615,25 @@ class ExecutionIcon(QGraphicsEllipseItem):
 
     def mark_execution_waiting(self):
         self._execution_state = "waiting for dependencies"
-        self._repaint(self._CLOCK, QColor("orange"))
+        self._repaint(self._CLOCK, self._ORANGE)
 
     def mark_execution_started(self):
         self._execution_state = "in progress"
-        self._repaint(self._CHECK, QColor("orange"))
+        self._repaint(self._CHECK, self._ORANGE)
 
     def mark_execution_finished(self, item_finish_state):
         if item_finish_state == ItemExecutionFinishState.SUCCESS:
             self._execution_state = "completed"
-            self._repaint(self._CHECK, QColor("green"))
+            self._repaint(self._CHECK, self._GREEN)
         elif item_finish_state == ItemExecutionFinishState.EXCLUDED:
             self._execution_state = "excluded"
-            self._repaint(self._CHECK, QColor("orange"))
+            self._repaint(self._CHECK, self._ORANGE)
         elif item_finish_state == ItemExecutionFinishState.SKIPPED:
             self._execution_state = "skipped"
-            self._repaint(self._SKIP, QColor("chocolate"))
+            self._repaint(self._SKIP, self._CHOCOLATE)
         else:
             self._execution_state = "failed"
-            self._repaint(self._CROSS, QColor("red"))
+            self._repaint(self._CROSS, self._RED)
 
     def hoverEnterEvent(self, event):
         tip = f"<p><b>Execution {self._execution_state}</b>. Select this item to see Console and Log messages.</p>"
@@ -15,6 +15,7 @@ Qt-based thread pool executor.
 :authors: M. Marin (ER)
 :date:   25.10.2022
 """
+from collections import deque
 import os
 from PySide2.QtCore import QMutex, QSemaphore, QThread
 
@@ -27,7 +28,7 @@ class QtBasedQueue:
     """A Qt-based clone of queue.Queue."""
 
     def __init__(self):
-        self._items = []
+        self._items = deque()
         self._mutex = QMutex()
         self._semafore = QSemaphore()
 
@@ -44,7 +45,7 @@ class QtBasedQueue:
         if not self._semafore.tryAcquire(1, timeout):
             raise TimeOutError()
         self._mutex.lock()
-        item = self._items.pop(0)
+        item = self._items.popleft()
         self._mutex.unlock()
         return item
 
@@ -53,26 +54,35 @@ class QtBasedFuture:
     """A Qt-based clone of concurrent.futures.Future."""
 
     def __init__(self):
-        self._result_queue = QtBasedQueue()
-        self._exception_queue = QtBasedQueue()
+        self._result = None
+        self._exception = None
+        self._done = QSemaphore()
 
     def set_result(self, result):
-        self._exception_queue.put(None)
-        self._result_queue.put(result)
+        self._result = result
+        self._done.release()
 
     def set_exception(self, exc):
-        self._exception_queue.put(exc)
-        self._result_queue.put(None)
+        self._exception = exc
+        self._done.release()
+
+    def _wait(self, timeout):
+        if timeout is None:
+            timeout = -1
+        timeout *= 1000
+        if not self._done.tryAcquire(1, timeout):
+            raise TimeOutError()
+        self._done.release()  # Keep the future done for subsequent calls.
 
     def result(self, timeout=None):
-        result = self._result_queue.get(timeout=timeout)
-        exc = self.exception(timeout=0)
-        if exc is not None:
-            raise exc
-        return result
+        self._wait(timeout)
+        if self._exception is not None:
+            raise self._exception
+        return self._result
 
     def exception(self, timeout=None):
-        return self._exception_queue.get(timeout=timeout)
+        self._wait(timeout)
+        return self._exception
 
 
 class QtBasedThread(QThread):
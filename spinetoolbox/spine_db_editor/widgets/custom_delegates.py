@@ -720,11 +720,22 @@ class ManageItemsDelegate(QStyledItemDelegate):
 
 
 class ManageEntityClassesDelegate(ManageItemsDelegate):
+    def __init__(self, parent):
+        """
+        Args:
+            parent (QWidget): parent widget
+        """
+        super().__init__(parent)
+        self._icons = {}
+
     def paint(self, painter, option, index):
         """Get a pixmap from the index data and paint it in the middle of the cell."""
         header = index.model().horizontal_header_labels()
         if header[index.column()] == 'display icon':
-            icon = object_icon(index.data())
+            display_icon = index.data()
+            icon = self._icons.get(display_icon)
+            if icon is None:
+                icon = self._icons[display_icon] = object_icon(display_icon)
             icon.paint(painter, option.rect, Qt.AlignVCenter | Qt.AlignHCenter)
         else:
             super().paint(painter, option, index)
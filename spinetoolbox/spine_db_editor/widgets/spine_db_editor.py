@@ -99,9 +99,7 @@ class SpineDBEditorBase(QMainWindow):
         self.setAttribute(Qt.WA_DeleteOnClose)
         self.setWindowTitle("")
         self.qsettings = self.db_mngr.qsettings
-        self.err_msg = QErrorMessage(self)
-        self.err_msg.setWindowTitle("Error")
-        self.err_msg.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
+        self._err_msg = None
         self.silenced = False
         max_screen_height = max([s.availableSize().height() for s in QGuiApplication.screens()])
         self.visible_rows = int(max_screen_height / preferred_row_height(self))
@@ -347,11 +345,33 @@ class SpineDBEditorBase(QMainWindow):
         browser = CommitViewer(self.qsettings, self.db_mngr, *self.db_maps, parent=self)
         browser.show()
 
+    @property
+    def err_msg(self):
+        """The error message dialog; created when first needed.
+
+        Returns:
+            QErrorMessage: error dialog
+        """
+        if self._err_msg is None:
+            self._err_msg = QErrorMessage(self)
+            self._err_msg.setWindowTitle("Error")
+            self._err_msg.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
+        return self._err_msg
+
+    @Slot(str)
+    def _show_error_message(self, message):
+        """Shows an error message in the error dialog.
+
+        Args:
+            message (str): message to show
+        """
+        self.err_msg.showMessage(message)
+
     def connect_signals(self):
         """Connects signals to slots."""
         # Message signals
         self.msg.connect(self.add_message)
-        self.msg_error.connect(self.err_msg.showMessage)
+        self.msg_error.connect(self._show_error_message)
         self.db_mngr.items_added.connect(self._handle_items_added)
         self.db_mngr.items_updated.connect(self._handle_items_updated)
         self.db_mngr.items_removed.connect(self._handle_items_removed)
@@ -18,7 +18,7 @@ The SpineDBManager class
 
 import json
 import os
-from PySide2.QtCore import Qt, QObject, Signal, Slot, QMutex
+from PySide2.QtCore import Qt, QObject, Signal, Slot, QMutex, QThread
 from PySide2.QtWidgets import QMessageBox, QWidget
 from PySide2.QtGui import QFontMetrics, QFont, QWindow
 from sqlalchemy.engine.url import URL
@@ -106,6 +106,7 @@ class SpineDBManager(QObject):
         self._db_maps = {}
         self.db_map_locks = {}
         self._workers = {}
+        self._export_workers = []
         self.listeners = dict()
         self.undo_stack = {}
         self.undo_action = {}
@@ -555,6 +556,8 @@ class SpineDBManager(QObject):
         while self._workers:
             _, worker = self._workers.popitem()
             worker.clean_up()
+        while self._export_workers:
+            self._export_workers.pop().clean_up()
         self.deleteLater()
 
     def refresh_session(self, *db_maps):
@@ -958,7 +961,7 @@ class SpineDBManager(QObject):
 
     def _import_data_cmds(self, db_map, data_for_import, db_map_error_log):
         for item_type, (to_add, to_update, import_error_log) in data_for_import:
-            db_map_error_log.setdefault(db_map, []).extend([str(x) for x in import_error_log])
+            db_map_error_log.setdefault(db_map, []).extend(map(str, import_error_log))
             if to_update:
                 yield UpdateItemsCommand(self, db_map, to_update, item_type, check=False)
             if to_add:
@@ -1538,11 +1541,45 @@ class SpineDBManager(QObject):
             return False
         return True
 
+    def _run_export(self, caller, function, *args):
+        """Runs given export function in a background thread.
+
+        The function reports through the worker's signals which are forwarded to caller in the GUI thread.
+        Qt drops the forwarding connections if caller gets destroyed before the export finishes.
+
+        Args:
+            caller (QObject): object with msg_error, file_exported and sqlite_file_exported signals
+            function (Callable): function to run; gets the worker as first argument
+            *args: function's other arguments
+        """
+        worker = _ExportWorker(function, *args)
+        self._export_workers.append(worker)
+        worker.msg_error.connect(caller.msg_error)
+        worker.file_exported.connect(caller.file_exported)
+        worker.sqlite_file_exported.connect(caller.sqlite_file_exported)
+        worker.finished.connect(lambda worker=worker: self._clean_up_export_worker(worker))
+        worker.start()
+
+    def _clean_up_export_worker(self, worker):
+        """Disposes of a finished export worker.
+
+        Args:
+            worker (_ExportWorker): finished worker
+        """
+        if worker in self._export_workers:
+            self._export_workers.remove(worker)
+            worker.clean_up()
+
     def export_to_sqlite(self, file_path, data_for_export, caller):
         """Exports given data into SQLite file."""
         url = URL("sqlite", database=file_path)
         if not self._is_url_available(url, caller):
             return
+        self._run_export(caller, self._do_export_to_sqlite, url, file_path, data_for_export)
+
+    @staticmethod
+    def _do_export_to_sqlite(worker, url, file_path, data_for_export):
+        """Writes given data into a new SQLite file; runs in export worker's thread."""
         create_new_spine_database(url)
         db_map = DatabaseMapping(url)
         import_data(db_map, **data_for_export)
@@ -1550,9 +1587,9 @@ class SpineDBManager(QObject):
             db_map.commit_session("Export data from Spine Toolbox.")
         except SpineDBAPIError as err:
             error_msg = {None: [f"[SpineDBAPIError] Unable to export file <b>{db_map.codename}</b>: {err.msg}"]}
-            caller.msg_error.emit(error_msg)
+            worker.msg_error.emit(error_msg)
         else:
-            caller.sqlite_file_exported.emit(file_path)
+            worker.sqlite_file_exported.emit(file_path)
         finally:
             db_map.connection.close()
 
@@ -1563,8 +1600,13 @@ class SpineDBManager(QObject):
             f.write(json_data)
         caller.file_exported.emit(file_path)
 
-    def export_to_excel(self, file_path, data_for_export, caller):  # pylint: disable=no-self-use
+    def export_to_excel(self, file_path, data_for_export, caller):
         """Exports given data into Excel file."""
+        self._run_export(caller, self._do_export_to_excel, file_path, data_for_export)
+
+    @staticmethod
+    def _do_export_to_excel(worker, file_path, data_for_export):
+        """Writes given data into an Excel file; runs in export worker's thread."""
         # NOTE: We import data into an in-memory Spine db and then export that to excel.
         url = URL("sqlite", database="")
         db_map = DatabaseMapping(url, create=True)
@@ -1578,12 +1620,12 @@ class SpineDBManager(QObject):
             error_msg = {
                 None: [f"Unable to export file <b>{file_name}</b>.<br/>Close the file in Excel and try again."]
             }
-            caller.msg_error.emit(error_msg)
+            worker.msg_error.emit(error_msg)
         except OSError:
             error_msg = {None: [f"[OSError] Unable to export file <b>{file_name}</b>."]}
-            caller.msg_error.emit(error_msg)
+            worker.msg_error.emit(error_msg)
         else:
-            caller.file_exported.emit(file_path)
+            worker.file_exported.emit(file_path)
         finally:
             db_map.connection.close()
 
@@ -1649,3 +1691,40 @@ class SpineDBManager(QObject):
         if multi_db_editor.isMinimized():
             multi_db_editor.showNormal()
         multi_db_editor.activateWindow()
+
+
+class _ExportWorker(QObject):
+    """Runs an export function in its own thread."""
+
+    finished = Signal()
+    msg_error = Signal(object)
+    file_exported = Signal(str)
+    sqlite_file_exported = Signal(str)
+
+    def __init__(self, function, *args):
+        """
+        Args:
+            function (Callable): function to run; gets the worker as first argument
+            *args: function's other arguments
+        """
+        super().__init__()
+        self._thread = QThread()
+        self.moveToThread(self._thread)
+        self._function = function
+        self._args = args
+
+    def start(self):
+        self._thread.started.connect(self._do_work)
+        self._thread.start()
+
+    @Slot()
+    def _do_work(self):
+        try:
+            self._function(self, *self._args)
+        finally:
+            self.finished.emit()
+
+    def clean_up(self):
+        self._thread.quit()
+        self._thread.wait()
+        self.deleteLater()
@@ -17,6 +17,7 @@ The SpineDBWorker class
 """
 from functools import wraps
 import itertools
+import weakref
 from PySide2.QtCore import QObject, Signal, Slot
 from spinedb_api import DatabaseMapping, SpineDBAPIError
 from .helpers import busy_effect, separate_metadata_and_item_metadata
@@ -24,6 +25,47 @@ from .qthread_pool_executor import QtBasedThreadPoolExecutor
 
 
 _CHUNK_SIZE = 1000
+_ADD_METHOD_NAMES = {
+    "object_class": "add_object_classes",
+    "object": "add_objects",
+    "relationship_class": "add_wide_relationship_classes",
+    "relationship": "add_wide_relationships",
+    "entity_group": "add_entity_groups",
+    "parameter_definition": "add_parameter_definitions",
+    "parameter_value": "add_parameter_values",
+    "parameter_value_list": "add_parameter_value_lists",
+    "list_value": "add_list_values",
+    "alternative": "add_alternatives",
+    "scenario": "add_scenarios",
+    "scenario_alternative": "add_scenario_alternatives",
+    "feature": "add_features",
+    "tool": "add_tools",
+    "tool_feature": "add_tool_features",
+    "tool_feature_method": "add_tool_feature_methods",
+    "metadata": "add_metadata",
+    "entity_metadata": "add_ext_entity_metadata",
+    "parameter_value_metadata": "add_ext_parameter_value_metadata",
+}
+_UPDATE_METHOD_NAMES = {
+    "object_class": "update_object_classes",
+    "object": "update_objects",
+    "relationship_class": "update_wide_relationship_classes",
+    "relationship": "update_wide_relationships",
+    "parameter_definition": "update_parameter_definitions",
+    "parameter_value": "update_parameter_values",
+    "parameter_value_list": "update_parameter_value_lists",
+    "list_value": "update_list_values",
+    "alternative": "update_alternatives",
+    "scenario": "update_scenarios",
+    "scenario_alternative": "update_scenario_alternatives",
+    "feature": "update_features",
+    "tool": "update_tools",
+    "tool_feature": "update_tool_features",
+    "tool_feature_method": "update_tool_feature_methods",
+    "metadata": "update_metadata",
+    "entity_metadata": "update_ext_entity_metadata",
+    "parameter_value_metadata": "update_ext_parameter_value_metadata",
+}
 
 
 def _db_map_lock(func):
@@ -73,9 +115,9 @@ class SpineDBWorker(QObject):
     def __init__(self, db_mngr, db_url):
         super().__init__()
         self._parents_by_type = {}
-        self._add_item_callbacks = {}
-        self._update_item_callbacks = {}
-        self._remove_item_callbacks = {}
+        self._add_item_callbacks = weakref.WeakKeyDictionary()
+        self._update_item_callbacks = weakref.WeakKeyDictionary()
+        self._remove_item_callbacks = weakref.WeakKeyDictionary()
         self._db_mngr = db_mngr
         self._db_url = db_url
         self._db_map = None
@@ -91,7 +133,7 @@ class SpineDBWorker(QObject):
         self._will_have_children_change.connect(self._handle_will_have_children_change)
 
     def _get_parents(self, item_type):
-        parents = self._parents_by_type.get(item_type, set())
+        parents = self._parents_by_type.get(item_type, weakref.WeakSet())
         for parent in list(parents):
             if parent.is_obsolete:
                 parents.remove(parent)
@@ -166,11 +208,22 @@ class SpineDBWorker(QObject):
         self._advance_query_callbacks[item_type] = {callback}
         self._executor.submit(self._do_advance_query, item_type)
 
-    @busy_effect
     @_db_map_lock
     def _do_advance_query(self, item_type):
         """Advances the DB query that fetches items of given type and caches the results.
 
+        Args:
+            item_type (str)
+
+        Returns:
+            bool: True if new items were fetched from the DB, False otherwise.
+        """
+        return self._advance_query_unlocked(item_type)
+
+    def _advance_query_unlocked(self, item_type):
+        """Advances the DB query that fetches items of given type and caches the results.
+        The caller must hold the database lock.
+
         Args:
             item_type (str)
 
@@ -205,7 +258,7 @@ class SpineDBWorker(QObject):
         Args:
             parent (FetchParent)
         """
-        parents = self._parents_by_type.setdefault(parent.fetch_item_type, set())
+        parents = self._parents_by_type.setdefault(parent.fetch_item_type, weakref.WeakSet())
         if parent not in parents:
             parents.add(parent)
             self._update_parents_will_have_children(parent.fetch_item_type)
@@ -275,21 +328,29 @@ class SpineDBWorker(QObject):
             bool: Whether the parent can stop fetching from now
         """
         item_type = parent.fetch_item_type
-        added_count = 0
-        for id_ in self._fetched_ids.get(item_type, [])[parent.position(self._db_map) :]:
-            parent.increment_position(self._db_map)
-            item = self._db_mngr.get_item(self._db_map, item_type, id_)
+        db_map = self._db_map
+        get_item = self._db_mngr.get_item
+        # Resolve the parent's filter and limits once instead of once per item.
+        accepts_item = parent.accepts_item
+        increment_position = parent.increment_position
+        chunk_size = parent.chunk_size
+        added_items = []
+        for id_ in self._fetched_ids.get(item_type, [])[parent.position(db_map) :]:
+            increment_position(db_map)
+            item = get_item(db_map, item_type, id_)
             if not item:
                 # Happens in one unit test
                 continue
-            if parent.accepts_item(item, self._db_map):
+            if accepts_item(item, db_map):
                 self._bind_item(parent, item)
                 if item.is_valid():
-                    parent.add_item(self._db_map, item)
-                    added_count += 1
-                if added_count == parent.chunk_size:
+                    added_items.append(item)
+                if len(added_items) == chunk_size:
                     break
-        if parent.chunk_size is None:
+        added_count = len(added_items)
+        if added_items:
+            parent.add_items(db_map, added_items)
+        if chunk_size is None:
             return False
         return added_count > 0
 
@@ -298,40 +359,54 @@ class SpineDBWorker(QObject):
         item.update_callbacks.add(self._make_update_item_callback(parent))
         item.remove_callbacks.add(self._make_remove_item_callback(parent))
 
-    def _add_item(self, parent, item):
+    def _add_item(self, parent_ref, item):
+        parent = parent_ref()
+        if parent is None:
+            return False
         if parent.is_obsolete:
             self._add_item_callbacks.pop(parent, None)
             return False
         parent.add_item(self._db_map, item)
         return True
 
-    def _update_item(self, parent, item):
+    def _update_item(self, parent_ref, item):
+        parent = parent_ref()
+        if parent is None:
+            return False
         if parent.is_obsolete:
             self._update_item_callbacks.pop(parent, None)
             return False
         parent.update_item(self._db_map, item)
         return True
 
-    def _remove_item(self, parent, item):
+    def _remove_item(self, parent_ref, item):
+        parent = parent_ref()
+        if parent is None:
+            return False
         if parent.is_obsolete:
             self._remove_item_callbacks.pop(parent, None)
             return False
         parent.remove_item(self._db_map, item)
         return True
 
+    # The callbacks reference their parent weakly so that cache items and callback registries
+    # don't keep parents alive after their owners are gone.
     def _make_add_item_callback(self, parent):
         if parent not in self._add_item_callbacks:
-            self._add_item_callbacks[parent] = lambda item, parent=parent: self._add_item(parent, item)
+            parent_ref = weakref.ref(parent)
+            self._add_item_callbacks[parent] = lambda item: self._add_item(parent_ref, item)
         return self._add_item_callbacks[parent]
 
     def _make_update_item_callback(self, parent):
         if parent not in self._update_item_callbacks:
-            self._update_item_callbacks[parent] = lambda item, parent=parent: self._update_item(parent, item)
+            parent_ref = weakref.ref(parent)
+            self._update_item_callbacks[parent] = lambda item: self._update_item(parent_ref, item)
         return self._update_item_callbacks[parent]
 
     def _make_remove_item_callback(self, parent):
         if parent not in self._remove_item_callbacks:
-            self._remove_item_callbacks[parent] = lambda item, parent=parent: self._remove_item(parent, item)
+            parent_ref = weakref.ref(parent)
+            self._remove_item_callbacks[parent] = lambda item: self._remove_item(parent_ref, item)
         return self._remove_item_callbacks[parent]
 
     def can_fetch_more(self, parent):
@@ -371,25 +446,28 @@ class SpineDBWorker(QObject):
     def fetch_all(self, fetch_item_types=None, only_descendants=False, include_ancestors=False):
         if fetch_item_types is None:
             fetch_item_types = set(self._db_map.ITEM_TYPES)
+        elif not only_descendants and not include_ancestors and self._fetched_item_types.issuperset(fetch_item_types):
+            return
+        else:
+            fetch_item_types = set(fetch_item_types)
         if only_descendants:
+            descendant_tablenames = self._db_map.descendant_tablenames
             fetch_item_types = {
-                descendant
-                for item_type in fetch_item_types
-                for descendant in self._db_map.descendant_tablenames.get(item_type, ())
+                descendant for item_type in fetch_item_types for descendant in descendant_tablenames.get(item_type, ())
             }
         if include_ancestors:
+            ancestor_tablenames = self._db_map.ancestor_tablenames
             fetch_item_types |= {
-                ancestor
-                for item_type in fetch_item_types
-                for ancestor in self._db_map.ancestor_tablenames.get(item_type, ())
+                ancestor for item_type in fetch_item_types for ancestor in ancestor_tablenames.get(item_type, ())
             }
         fetch_item_types -= self._fetched_item_types
         if fetch_item_types:
             _ = self._executor.submit(self._fetch_all, fetch_item_types).result()
 
+    @_db_map_lock
     def _fetch_all(self, item_types):
         for item_type in item_types:
-            while self._do_advance_query(item_type):
+            while self._advance_query_unlocked(item_type):
                 pass
 
     def _populate_commit_cache(self, item_type, items):
@@ -431,27 +509,7 @@ class SpineDBWorker(QObject):
             cache (dict): Cache
             callback (None or function): something to call with the result
         """
-        method_name = {
-            "object_class": "add_object_classes",
-            "object": "add_objects",
-            "relationship_class": "add_wide_relationship_classes",
-            "relationship": "add_wide_relationships",
-            "entity_group": "add_entity_groups",
-            "parameter_definition": "add_parameter_definitions",
-            "parameter_value": "add_parameter_values",
-            "parameter_value_list": "add_parameter_value_lists",
-            "list_value": "add_list_values",
-            "alternative": "add_alternatives",
-            "scenario": "add_scenarios",
-            "scenario_alternative": "add_scenario_alternatives",
-            "feature": "add_features",
-            "tool": "add_tools",
-            "tool_feature": "add_tool_features",
-            "tool_feature_method": "add_tool_feature_methods",
-            "metadata": "add_metadata",
-            "entity_metadata": "add_ext_entity_metadata",
-            "parameter_value_metadata": "add_ext_parameter_value_metadata",
-        }[item_type]
+        method_name = _ADD_METHOD_NAMES[item_type]
         check &= not self._committing
         readd |= self._committing
         with self._db_map.override_committing(self._committing):
@@ -491,26 +549,7 @@ class SpineDBWorker(QObject):
             cache (dict): Cache
             callback (None or function): something to call with the result
         """
-        method_name = {
-            "object_class": "update_object_classes",
-            "object": "update_objects",
-            "relationship_class": "update_wide_relationship_classes",
-            "relationship": "update_wide_relationships",
-            "parameter_definition": "update_parameter_definitions",
-            "parameter_value": "update_parameter_values",
-            "parameter_value_list": "update_parameter_value_lists",
-            "list_value": "update_list_values",
-            "alternative": "update_alternatives",
-            "scenario": "update_scenarios",
-            "scenario_alternative": "update_scenario_alternatives",
-            "feature": "update_features",
-            "tool": "update_tools",
-            "tool_feature": "update_tool_features",
-            "tool_feature_method": "update_tool_feature_methods",
-            "metadata": "update_metadata",
-            "entity_metadata": "update_ext_entity_metadata",
-            "parameter_value_metadata": "update_ext_parameter_value_metadata",
-        }[item_type]
+        method_name = _UPDATE_METHOD_NAMES[item_type]
         check &= not self._committing
         with self._db_map.override_committing(self._committing):
             items, errors = getattr(self._db_map, method_name)(*orig_items, check=check, return_items=True, cache=cache)
@@ -532,9 +571,15 @@ class SpineDBWorker(QObject):
         """Removes items from database.
 
         Args:
-            ids_per_type (dict): lists of items to remove keyed by item type (str)
+            item_type (str): item type
+            ids (set): ids of items to remove
+            callback (None or function): something to call with the result
         """
         if self._committing:
+            if not ids:
+                if callback is not None:
+                    callback({})
+                return
             with self._db_map.override_committing(self._committing):
                 try:
                     self._db_map.cascade_remove_items(**{item_type: ids})
@@ -40,6 +40,18 @@ class SpineEngineManagerBase:
         """
         raise NotImplementedError()
 
+    def get_engine_events(self, max_n):
+        """Gets at most given number of pending events from a running engine.
+        Blocks until at least one event is available.
+
+        Args:
+            max_n (int): maximum number of events to return
+
+        Returns:
+            list of tuple: events as returned by ``get_engine_event()``
+        """
+        return [self.get_engine_event()]
+
     def stop_engine(self):
         """Stops a running engine."""
         raise NotImplementedError()
@@ -140,14 +152,38 @@ class LocalSpineEngineManager(SpineEngineManagerBase):
     def __init__(self):
         super().__init__()
         self._engine = None
+        self._events = queue.SimpleQueue()
+        self._event_pump = None
 
     def run_engine(self, engine_data):
         from spine_engine.spine_engine import SpineEngine  # pylint: disable=import-outside-toplevel
 
         self._engine = SpineEngine(**engine_data)
+        self._event_pump = threading.Thread(
+            name="LocalSpineEngineManagerEventPumpThread", target=self._pump_events, daemon=True
+        )
+        self._event_pump.start()
+
+    def _pump_events(self):
+        """Moves engine's events to a queue that can be drained without blocking."""
+        while True:
+            event = self._engine.get_event()
+            self._events.put(event)
+            if event[0] == "dag_exec_finished":
+                break
 
     def get_engine_event(self):
-        return self._engine.get_event()
+        return self._events.get()
+
+    def get_engine_events(self, max_n):
+        """See base class."""
+        events = [self._events.get()]
+        try:
+            while len(events) < max_n:
+                events.append(self._events.get_nowait())
+        except queue.Empty:
+            pass
+        return events
 
     def stop_engine(self):
         self._engine.stop()
@@ -219,7 +255,7 @@ class RemoteSpineEngineManager(SpineEngineManagerBase):
         self.engine_client = None
         self.job_id = job_id  # Job Id of ProjectExtractionService for finding the extracted project on server
         self.exec_job_id = ""  # Job Id of RemoteExecutionService for stopping the execution
-        self.q = queue.Queue()  # Queue for sending events forward to SpineEngineWorker
+        self.q = queue.SimpleQueue()  # Queue for sending events forward to SpineEngineWorker
 
     def make_engine_client(self, host, port, security, sec_folder, ping=True):
         """Creates a client for connecting to Spine Engine Server."""
@@ -253,6 +289,16 @@ class RemoteSpineEngineManager(SpineEngineManagerBase):
         """Returns the next engine execution event."""
         return self.q.get()
 
+    def get_engine_events(self, max_n):
+        """See base class."""
+        events = [self.q.get()]
+        try:
+            while len(events) < max_n:
+                events.append(self.q.get_nowait())
+        except queue.Empty:
+            pass
+        return events
+
     def clean_up(self):
         """Closes EngineClient and joins _runner thread if still active."""
         self.engine_client.close()
@@ -14,70 +14,122 @@ Contains SpineEngineWorker.
 :authors: M. Marin (KTH)
 :date:   14.10.2020
 """
-import copy
+import pickle
+import sys
 from PySide2.QtCore import Signal, Slot, QObject, QThread
 from PySide2.QtWidgets import QMessageBox
 from spine_engine.exception import EngineInitFailed, RemoteEngineInitFailed
 from spine_engine.spine_engine import ItemExecutionFinishState, SpineEngineState
-from .spine_engine_manager import make_engine_manager, LocalSpineEngineManager
+from .spine_engine_manager import make_engine_manager
 from .helpers import get_upgrade_db_promt_text
 
+_MAX_EVENTS_PER_BATCH = 64
+_MESSAGE_EVENT_TYPES = {"event_msg", "process_msg"}
+
+
+def _icon_handles(item):
+    """Resolves the parts of project item's icon that are touched during execution.
+
+    Args:
+        item (ProjectItem): project item
+
+    Returns:
+        tuple: execution icon and animation signaller or None if the icon is not animated
+    """
+    icon = item.get_icon()
+    return icon.execution_icon, icon.animation_signaller
+
 
 @Slot(list)
-def _handle_dag_execution_started(project_items):
-    for item in project_items:
-        item.get_icon().execution_icon.mark_execution_waiting()
+def _handle_dag_execution_started(icon_handles):
+    for execution_icon, _ in icon_handles:
+        execution_icon.mark_execution_waiting()
 
 
 @Slot(object, object)
-def _handle_node_execution_started(item, direction):
-    icon = item.get_icon()
+def _handle_node_execution_started(icon_handles, direction):
     if direction == "FORWARD":
-        icon.execution_icon.mark_execution_started()
-        if hasattr(icon, "animation_signaller"):
-            icon.animation_signaller.animation_started.emit()
+        execution_icon, animation_signaller = icon_handles
+        execution_icon.mark_execution_started()
+        if animation_signaller is not None:
+            animation_signaller.animation_started.emit()
 
 
-@Slot(object, object, object, object)
-def _handle_node_execution_finished(item, direction, item_state):
-    icon = item.get_icon()
+@Slot(object, object, object)
+def _handle_node_execution_finished(icon_handles, direction, item_state):
     if direction == "FORWARD":
-        icon.execution_icon.mark_execution_finished(item_state)
-        if hasattr(icon, "animation_signaller"):
-            icon.animation_signaller.animation_stopped.emit()
+        execution_icon, animation_signaller = icon_handles
+        execution_icon.mark_execution_finished(item_state)
+        if animation_signaller is not None:
+            animation_signaller.animation_stopped.emit()
 
 
-@Slot(object, str, str)
+@Slot(object, str, str, str)
 def _handle_event_message_arrived(item, filter_id, msg_type, msg_text):
     item.add_event_message(filter_id, msg_type, msg_text)
 
 
-@Slot(object, str, str)
+@Slot(list)
+def _handle_log_messages_arrived(messages):
+    for is_process_message, item, filter_id, msg_type, msg_text in messages:
+        if is_process_message:
+            item.add_process_message(filter_id, msg_type, msg_text)
+        else:
+            item.add_event_message(filter_id, msg_type, msg_text)
+
+
+@Slot(object, str, str, str)
 def _handle_process_message_arrived(item, filter_id, msg_type, msg_text):
     item.add_process_message(filter_id, msg_type, msg_text)
 
 
-@Slot(dict, object)
-def _handle_prompt_arrived(prompt, engine_mngr):
-    prompt_type = prompt["type"]
-    if prompt_type == "upgrade_db":
-        url = prompt["url"]
-        current = prompt["current"]
-        expected = prompt["expected"]
-        text, info_text = get_upgrade_db_promt_text(url, current, expected)
-    else:
-        info_text = ""
-        text = prompt["text"]
-    item_name = prompt["item_name"]
-    # pylint: disable=undefined-variable
-    box = QMessageBox(
-        QMessageBox.Question, item_name, text, buttons=QMessageBox.Yes | QMessageBox.No, parent=qApp.activeWindow()
-    )
-    if info_text:
+class _PromptHandler(QObject):
+    """Asks user to answer engine's prompts. Lives in the GUI thread and reuses a single message box.
+
+    The box is parented to the active window only while it is shown
+    so closing that window later does not delete the box along with it.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._box = None
+
+    def _get_box(self):
+        """Returns the message box, creating it on first use.
+
+        Returns:
+            QMessageBox: message box
+        """
+        if self._box is None:
+            self._box = QMessageBox(QMessageBox.Question, "", "", buttons=QMessageBox.Yes | QMessageBox.No)
+        return self._box
+
+    @Slot(dict, object)
+    def handle_prompt(self, prompt, engine_mngr):
+        prompt_type = prompt["type"]
+        if prompt_type == "upgrade_db":
+            url = prompt["url"]
+            current = prompt["current"]
+            expected = prompt["expected"]
+            text, info_text = get_upgrade_db_promt_text(url, current, expected)
+        else:
+            info_text = ""
+            text = prompt["text"]
+        item_name = prompt["item_name"]
+        box = self._get_box()
+        box.setWindowTitle(item_name)
+        box.setText(text)
         box.setInformativeText(info_text)
-    answer = box.exec_()
-    accepted = answer == QMessageBox.Yes
-    engine_mngr.answer_prompt(item_name, accepted)
+        box.setParent(qApp.activeWindow(), box.windowFlags())  # pylint: disable=undefined-variable
+        answer = box.exec_()
+        box.setParent(None, box.windowFlags())
+        accepted = answer == QMessageBox.Yes
+        engine_mngr.answer_prompt(item_name, accepted)
+
+    def clean_up(self):
+        if self._box is not None:
+            self._box.deleteLater()
+        self.deleteLater()
 
 
 @Slot(object)
@@ -85,18 +137,52 @@ def _handle_flash_arrived(connection):
     connection.graphics_item.run_execution_animation()
 
 
+def _coalesce_messages(events):
+    """Merges consecutive process messages that share item, filter id and message type.
+
+    Event messages are left alone since each of them is a separate, time stamped entry in the log.
+
+    Args:
+        events (list of tuple): engine events
+
+    Yields:
+        tuple: event type and event data
+    """
+    pending_type = None
+    pending_data = None
+    for event_type, data in events:
+        if event_type == "process_msg":
+            if (
+                event_type == pending_type
+                and data["item_name"] == pending_data["item_name"]
+                and data["filter_id"] == pending_data["filter_id"]
+                and data["msg_type"] == pending_data["msg_type"]
+            ):
+                pending_data["msg_text"] += "<br/>" + data["msg_text"]
+                continue
+            if pending_type is not None:
+                yield pending_type, pending_data
+            pending_type, pending_data = event_type, dict(data)
+            continue
+        if pending_type is not None:
+            yield pending_type, pending_data
+            pending_type = pending_data = None
+        yield event_type, data
+    if pending_type is not None:
+        yield pending_type, pending_data
+
+
 @Slot(list)
-def _mark_all_items_failed(items):
+def _mark_all_items_failed(icon_handles):
     """Fails all project items.
 
     Args:
-        items (list of ProjectItem): project items
+        icon_handles (list of tuple): project items' execution icons and animation signallers
     """
-    for item in items:
-        icon = item.get_icon()
-        icon.execution_icon.mark_execution_finished(ItemExecutionFinishState.FAILURE)
-        if hasattr(icon, "animation_signaller"):
-            icon.animation_signaller.animation_stopped.emit()
+    for execution_icon, animation_signaller in icon_handles:
+        execution_icon.mark_execution_finished(ItemExecutionFinishState.FAILURE)
+        if animation_signaller is not None:
+            animation_signaller.animation_stopped.emit()
 
 
 class SpineEngineWorker(QObject):
@@ -106,6 +192,7 @@ class SpineEngineWorker(QObject):
     _node_execution_started = Signal(object, object)
     _node_execution_finished = Signal(object, object, object)
     _event_message_arrived = Signal(object, str, str, str)
+    _log_messages_arrived = Signal(list)
     _process_message_arrived = Signal(object, str, str, str)
     _prompt_arrived = Signal(dict, object)
     _flash_arrived = Signal(object)
@@ -124,18 +211,55 @@ class SpineEngineWorker(QObject):
         """
         super().__init__()
         self._engine_data = engine_data
-        exec_remotely = engine_data["settings"].get("engineSettings/remoteExecutionEnabled", "false") == "true"
-        self._engine_mngr = make_engine_manager(exec_remotely, job_id)
+        settings = engine_data.get("settings", {})
+        self._exec_remotely = str(settings.get("engineSettings/remoteExecutionEnabled", "false")).lower() == "true"
+        self._engine_mngr = make_engine_manager(self._exec_remotely, job_id)
         self.dag = dag
         self.dag_identifier = dag_identifier
         self._engine_final_state = "UNKNOWN"
         self._executing_items = set()
         self._project_items = project_items
         self._connections = connections
+        self._get_project_item = project_items.get
+        self._get_connection = connections.get
+        self._all_items = tuple(project_items.values())
+        self._icon_handles = {}
+        self._all_icon_handle_list = None
+        self._persistent_output_key = None
+        self._persistent_output = []
         self._logger = logger
         self.event_messages = {}
         self.process_messages = {}
         self.successful_executions = []
+        self._coalescing = False
+        self._pending_log_messages = None
+        self._event_handlers = {
+            "exec_started": self._handle_node_execution_started,
+            "exec_finished": self._handle_node_execution_finished,
+            "event_msg": self._handle_event_msg,
+            "process_msg": self._handle_process_msg,
+            "standard_execution_msg": self._handle_standard_execution_msg,
+            "persistent_execution_msg": self._handle_persistent_execution_msg,
+            "kernel_execution_msg": self._handle_kernel_execution_msg,
+            "prompt": self._handle_prompt,
+            "flash": self._handle_flash,
+            "server_status_msg": self._handle_server_status_msg,
+        }
+        self._persistent_execution_msg_handlers = {
+            "persistent_started": self._handle_persistent_started,
+            "persistent_failed_to_start": self._handle_persistent_failed_to_start,
+            "stdin": self._handle_persistent_stdin,
+            "execution_started": self._handle_persistent_execution_started,
+        }
+        self._kernel_execution_msg_handlers = {
+            "kernel_started": self._handle_kernel_started,
+            "kernel_spec_not_found": self._handle_kernel_spec_not_found,
+            "conda_not_found": self._handle_conda_not_found,
+            "execution_failed_to_start": self._handle_kernel_execution_failed_to_start,
+            "kernel_spec_exe_not_found": self._handle_kernel_spec_exe_not_found,
+            "execution_started": self._handle_kernel_execution_started,
+        }
+        self._prompt_handler = _PromptHandler()
         self._thread = QThread()
         self.moveToThread(self._thread)
         self._thread.started.connect(self.do_work)
@@ -152,7 +276,8 @@ class SpineEngineWorker(QObject):
         Returns:
             dict
         """
-        return copy.deepcopy(self._engine_data)
+        # Engine data is plain Python data, so a pickle round trip gives a deep copy a lot faster than deepcopy().
+        return pickle.loads(pickle.dumps(self._engine_data, pickle.HIGHEST_PROTOCOL))
 
     def set_engine_data(self, engine_data):
         """Sets the engine data.
@@ -162,14 +287,38 @@ class SpineEngineWorker(QObject):
         """
         self._engine_data = engine_data
 
-    @Slot(object, str, str)
+    @Slot(object, str, str, str)
     def _handle_event_message_arrived_silent(self, item, filter_id, msg_type, msg_text):
         self.event_messages.setdefault(msg_type, []).append(msg_text)
 
-    @Slot(object, str, str)
+    @Slot(object, str, str, str)
     def _handle_process_message_arrived_silent(self, item, filter_id, msg_type, msg_text):
         self.process_messages.setdefault(msg_type, []).append(msg_text)
 
+    def _get_icon_handles(self, item):
+        """Returns memoized execution icon and animation signaller of given project item.
+
+        Args:
+            item (ProjectItem): project item
+
+        Returns:
+            tuple: execution icon and animation signaller or None
+        """
+        handles = self._icon_handles.get(item)
+        if handles is None:
+            handles = self._icon_handles[item] = _icon_handles(item)
+        return handles
+
+    def _all_icon_handles(self):
+        """Returns memoized icon handles of all project items.
+
+        Returns:
+            list of tuple: execution icons and animation signallers
+        """
+        if self._all_icon_handle_list is None:
+            self._all_icon_handle_list = [self._get_icon_handles(item) for item in self._all_items]
+        return self._all_icon_handle_list
+
     def stop_engine(self):
         self._engine_mngr.stop_engine()
 
@@ -184,12 +333,16 @@ class SpineEngineWorker(QObject):
             self._event_message_arrived.connect(self._handle_event_message_arrived_silent)
             self._process_message_arrived.connect(self._handle_process_message_arrived_silent)
             return
+        # Messages are merged and batched only when they end up in the GUI, silent listeners get them one by one.
+        self._coalescing = True
+        self._pending_log_messages = []
         self._dag_execution_started.connect(_handle_dag_execution_started)
         self._node_execution_started.connect(_handle_node_execution_started)
         self._node_execution_finished.connect(_handle_node_execution_finished)
         self._event_message_arrived.connect(_handle_event_message_arrived)
+        self._log_messages_arrived.connect(_handle_log_messages_arrived)
         self._process_message_arrived.connect(_handle_process_message_arrived)
-        self._prompt_arrived.connect(_handle_prompt_arrived)
+        self._prompt_arrived.connect(self._prompt_handler.handle_prompt)
         self._flash_arrived.connect(_handle_flash_arrived)
 
     def start(self, silent=False):
@@ -201,7 +354,7 @@ class SpineEngineWorker(QObject):
         """
         self._connect_log_signals(silent)
         self._all_items_failed.connect(_mark_all_items_failed)
-        self._dag_execution_started.emit(list(self._project_items.values()))
+        self._dag_execution_started.emit(self._all_icon_handles())
         self._thread.start()
 
     @Slot()
@@ -212,7 +365,7 @@ class SpineEngineWorker(QObject):
         except EngineInitFailed as error:
             self._logger.msg_error.emit(f"Failed to start engine: {error}")
             self._engine_final_state = str(SpineEngineState.FAILED)
-            self._all_items_failed.emit(list(self._project_items.values()))
+            self._all_items_failed.emit(self._all_icon_handles())
             self.finished.emit()
             return
         except RemoteEngineInitFailed as e:
@@ -220,35 +373,91 @@ class SpineEngineWorker(QObject):
                 f"Server is not responding. {e}. Check settings " f"in <b>File->Settings->Engine</b>."
             )
             self._engine_final_state = str(SpineEngineState.FAILED)
-            self._all_items_failed.emit(list(self._project_items.values()))
+            self._all_items_failed.emit(self._all_icon_handles())
             self.finished.emit()
             return
         while True:
-            event_type, data = self._engine_mngr.get_engine_event()
-            self._process_event(event_type, data)
-            if event_type == "dag_exec_finished":
-                self._engine_final_state = data
-                break
-            elif event_type == "remote_execution_init_failed" or event_type == "server_init_failed":
-                self._logger.msg_error.emit(f"{data}")
-                self._engine_final_state = str(SpineEngineState.FAILED)
-                self._all_items_failed.emit(list(self._project_items.values()))
+            events = self._engine_mngr.get_engine_events(_MAX_EVENTS_PER_BATCH)
+            if self._process_events(events):
                 break
         self.finished.emit()
 
+    def _process_events(self, events):
+        """Processes a batch of engine events.
+
+        Args:
+            events (list of tuple): engine events
+
+        Returns:
+            bool: True if execution has finished, False otherwise
+        """
+        if self._coalescing:
+            events = _coalesce_messages(events)
+        try:
+            for event_type, data in events:
+                if event_type not in _MESSAGE_EVENT_TYPES:
+                    # Collected log messages must reach the GUI before anything this event emits.
+                    self._flush_log_messages()
+                self._process_event(event_type, data)
+                if event_type == "dag_exec_finished":
+                    self._engine_final_state = data
+                    return True
+                if event_type == "remote_execution_init_failed" or event_type == "server_init_failed":
+                    self._logger.msg_error.emit(f"{data}")
+                    self._engine_final_state = str(SpineEngineState.FAILED)
+                    self._all_items_failed.emit(self._all_icon_handles())
+                    return True
+            return False
+        finally:
+            self._flush_persistent_output()
+            self._flush_log_messages()
+
+    def _add_event_message(self, item, filter_id, msg_type, msg_text):
+        """Forwards an event message to item, or collects it to be sent when current batch of events is done.
+
+        Args:
+            item (ProjectItem or LoggingConnection): message's receiver
+            filter_id (str): filter identifier
+            msg_type (str): message type
+            msg_text (str): message text
+        """
+        if self._pending_log_messages is None:
+            self._event_message_arrived.emit(item, filter_id, msg_type, msg_text)
+            return
+        self._flush_persistent_output()
+        self._pending_log_messages.append((False, item, filter_id, msg_type, msg_text))
+
+    def _add_process_message(self, item, filter_id, msg_type, msg_text):
+        """Forwards a process message to item, or collects it to be sent when current batch of events is done.
+
+        Args:
+            item (ProjectItem or LoggingConnection): message's receiver
+            filter_id (str): filter identifier
+            msg_type (str): message type
+            msg_text (str): message text
+        """
+        if self._pending_log_messages is None:
+            self._process_message_arrived.emit(item, filter_id, msg_type, msg_text)
+            return
+        self._flush_persistent_output()
+        self._pending_log_messages.append((True, item, filter_id, msg_type, msg_text))
+
+    def _flush_log_messages(self):
+        """Sends collected event and process messages to the GUI thread in their original order."""
+        if not self._pending_log_messages:
+            return
+        self._log_messages_arrived.emit(self._pending_log_messages)
+        self._pending_log_messages = []
+
     def _process_event(self, event_type, data):
-        handler = {
-            "exec_started": self._handle_node_execution_started,
-            "exec_finished": self._handle_node_execution_finished,
-            "event_msg": self._handle_event_msg,
-            "process_msg": self._handle_process_msg,
-            "standard_execution_msg": self._handle_standard_execution_msg,
-            "persistent_execution_msg": self._handle_persistent_execution_msg,
-            "kernel_execution_msg": self._handle_kernel_execution_msg,
-            "prompt": self._handle_prompt,
-            "flash": self._handle_flash,
-            "server_status_msg": self._handle_server_status_msg,
-        }.get(event_type)
+        # Log messages make up the bulk of engine events so they skip the dispatch table.
+        if event_type == "process_msg":
+            self._do_handle_process_msg(**data)
+            return
+        if event_type == "event_msg":
+            self._do_handle_event_msg(**data)
+            return
+        handler = self._event_handlers.get(event_type)
         if handler is None:
             return
         handler(data)
@@ -264,89 +473,119 @@ class SpineEngineWorker(QObject):
         item = self._project_items[msg["item_name"]]
         if msg["type"] == "execution_failed_to_start":
             msg_text = f"Program <b>{msg['program']}</b> failed to start: {msg['error']}"
-            self._event_message_arrived.emit(item, msg["filter_id"], "msg_error", msg_text)
+            self._add_event_message(item, msg["filter_id"], "msg_error", msg_text)
         elif msg["type"] == "execution_started":
-            self._event_message_arrived.emit(
-                item, msg["filter_id"], "msg", f"\tStarting program <b>{msg['program']}</b>"
-            )
-            self._event_message_arrived.emit(item, msg["filter_id"], "msg", f"\tArguments: <b>{msg['args']}</b>")
-            self._event_message_arrived.emit(
+            self._add_event_message(item, msg["filter_id"], "msg", f"\tStarting program <b>{msg['program']}</b>")
+            self._add_event_message(item, msg["filter_id"], "msg", f"\tArguments: <b>{msg['args']}</b>")
+            self._add_event_message(
                 item, msg["filter_id"], "msg_warning", "\tExecution is in progress. See messages below (stdout&stderr)"
             )
 
     def _handle_persistent_execution_msg(self, msg):
-        item = self._project_items.get(msg["item_name"]) or self._connections.get(msg["item_name"])
+        item_name = msg["item_name"]
+        item = self._get_project_item(item_name) or self._get_connection(item_name)
         msg_type = msg["type"]
-        if msg_type == "persistent_started":
-            self._logger.persistent_console_requested.emit(item, msg["filter_id"], msg["key"], msg["language"])
-        elif msg_type == "persistent_failed_to_start":
-            msg_text = (
-                f"Unable to start persistent process <b>{msg['args']}</b>: {msg['error']}."
-                "Please go to Settings->Tools and check your setup."
-            )
-            self._event_message_arrived.emit(item, msg["filter_id"], "msg_error", msg_text)
-        elif msg_type == "stdin":
-            self._logger.add_persistent_stdin(item, msg["filter_id"], msg["data"])
-        elif msg_type == "stdout":
-            self._logger.add_persistent_stdout(item, msg["filter_id"], msg["data"])
-        elif msg_type == "stderr":
-            self._logger.add_persistent_stderr(item, msg["filter_id"], msg["data"])
-        elif msg_type == "execution_started":
-            self._event_message_arrived.emit(
-                item, msg["filter_id"], "msg", f"*** Starting execution on persistent process <b>{msg['args']}</b> ***"
-            )
-            self._event_message_arrived.emit(item, msg["filter_id"], "msg_warning", "See Console for messages")
+        if msg_type == "stdout" or msg_type == "stderr":
+            key = (item, msg["filter_id"], msg_type)
+            if key != self._persistent_output_key:
+                self._flush_persistent_output()
+                self._persistent_output_key = key
+            self._persistent_output.append(msg["data"])
+            return
+        self._flush_persistent_output()
+        handler = self._persistent_execution_msg_handlers.get(msg_type)
+        if handler is not None:
+            handler(item, msg)
+
+    def _handle_persistent_started(self, item, msg):
+        self._logger.persistent_console_requested.emit(item, msg["filter_id"], msg["key"], msg["language"])
+
+    def _handle_persistent_failed_to_start(self, item, msg):
+        msg_text = (
+            f"Unable to start persistent process <b>{msg['args']}</b>: {msg['error']}."
+            "Please go to Settings->Tools and check your setup."
+        )
+        self._add_event_message(item, msg["filter_id"], "msg_error", msg_text)
+
+    def _handle_persistent_stdin(self, item, msg):
+        self._logger.add_persistent_stdin(item, msg["filter_id"], msg["data"])
+
+    def _handle_persistent_execution_started(self, item, msg):
+        self._add_event_message(
+            item, msg["filter_id"], "msg", f"*** Starting execution on persistent process <b>{msg['args']}</b> ***"
+        )
+        self._add_event_message(item, msg["filter_id"], "msg_warning", "See Console for messages")
+
+    def _flush_persistent_output(self):
+        """Sends buffered persistent console stdout or stderr to logger as a single chunk."""
+        if not self._persistent_output:
+            return
+        item, filter_id, msg_type = self._persistent_output_key
+        data = "\n".join(self._persistent_output)
+        self._persistent_output.clear()
+        self._persistent_output_key = None
+        if msg_type == "stdout":
+            self._logger.add_persistent_stdout(item, filter_id, data)
+        else:
+            self._logger.add_persistent_stderr(item, filter_id, data)
 
     def _handle_kernel_execution_msg(self, msg):
-        item = self._project_items[msg["item_name"]] or self._connections.get(msg["item_name"])
-        if msg["type"] == "kernel_started":
-            self._logger.jupyter_console_requested.emit(
-                item,
-                msg["filter_id"],
-                msg["kernel_name"],
-                msg["connection_file"],
-                msg.get("connection_file_dict", dict()),
-            )
-        elif msg["type"] == "kernel_spec_not_found":
-            msg_text = (
-                f"Unable to find kernel spec <b>{msg['kernel_name']}</b>"
-                "<br/>For Python Tools, select a kernel spec in the Tool specification editor."
-                "<br/>For Julia Tools, select a kernel spec from File->Settings->Tools."
-            )
-            self._event_message_arrived.emit(item, msg["filter_id"], "msg_error", msg_text)
-        elif msg["type"] == "conda_not_found":
-            msg_text = (
-                f"{msg['error']}<br/>Couldn't call Conda. Set up <b>Conda executable</b> "
-                f"in <b>File->Settings->Tools</b>."
-            )
-            self._event_message_arrived.emit(item, msg["filter_id"], "msg_error", msg_text)
-        elif msg["type"] == "execution_failed_to_start":
-            msg_text = f"Execution on kernel <b>{msg['kernel_name']}</b> failed to start: {msg['error']}"
-            self._event_message_arrived.emit(item, msg["filter_id"], "msg_error", msg_text)
-        elif msg["type"] == "kernel_spec_exe_not_found":
-            msg_text = (
-                f"Invalid kernel spec ({msg['kernel_name']}). File <b>{msg['kernel_exe_path']}</b> " f"does not exist."
-            )
-            self._event_message_arrived.emit(item, msg["filter_id"], "msg_error", msg_text)
-        elif msg["type"] == "execution_started":
-            self._event_message_arrived.emit(
-                item, msg["filter_id"], "msg", f"*** Starting execution on kernel spec <b>{msg['kernel_name']}</b> ***"
-            )
-            self._event_message_arrived.emit(item, msg["filter_id"], "msg_warning", "See Console for messages")
+        handler = self._kernel_execution_msg_handlers.get(msg["type"])
+        if handler is None:
+            return
+        item_name = msg["item_name"]
+        item = self._get_project_item(item_name) or self._get_connection(item_name)
+        handler(item, msg)
+
+    def _handle_kernel_started(self, item, msg):
+        self._logger.jupyter_console_requested.emit(
+            item, msg["filter_id"], msg["kernel_name"], msg["connection_file"], msg.get("connection_file_dict", dict())
+        )
+
+    def _handle_kernel_spec_not_found(self, item, msg):
+        msg_text = (
+            f"Unable to find kernel spec <b>{msg['kernel_name']}</b>"
+            "<br/>For Python Tools, select a kernel spec in the Tool specification editor."
+            "<br/>For Julia Tools, select a kernel spec from File->Settings->Tools."
+        )
+        self._add_event_message(item, msg["filter_id"], "msg_error", msg_text)
+
+    def _handle_conda_not_found(self, item, msg):
+        msg_text = (
+            f"{msg['error']}<br/>Couldn't call Conda. Set up <b>Conda executable</b> "
+            f"in <b>File->Settings->Tools</b>."
+        )
+        self._add_event_message(item, msg["filter_id"], "msg_error", msg_text)
+
+    def _handle_kernel_execution_failed_to_start(self, item, msg):
+        msg_text = f"Execution on kernel <b>{msg['kernel_name']}</b> failed to start: {msg['error']}"
+        self._add_event_message(item, msg["filter_id"], "msg_error", msg_text)
+
+    def _handle_kernel_spec_exe_not_found(self, item, msg):
+        msg_text = (
+            f"Invalid kernel spec ({msg['kernel_name']}). File <b>{msg['kernel_exe_path']}</b> " f"does not exist."
+        )
+        self._add_event_message(item, msg["filter_id"], "msg_error", msg_text)
+
+    def _handle_kernel_execution_started(self, item, msg):
+        self._add_event_message(
+            item, msg["filter_id"], "msg", f"*** Starting execution on kernel spec <b>{msg['kernel_name']}</b> ***"
+        )
+        self._add_event_message(item, msg["filter_id"], "msg_warning", "See Console for messages")
 
     def _handle_process_msg(self, data):
         self._do_handle_process_msg(**data)
 
     def _do_handle_process_msg(self, item_name, filter_id, msg_type, msg_text):
-        item = self._project_items.get(item_name) or self._connections.get(item_name)
-        self._process_message_arrived.emit(item, filter_id, msg_type, msg_text)
+        item = self._get_project_item(item_name) or self._get_connection(item_name)
+        self._add_process_message(item, sys.intern(filter_id or ""), sys.intern(msg_type), msg_text)
 
     def _handle_event_msg(self, data):
         self._do_handle_event_msg(**data)
 
     def _do_handle_event_msg(self, item_name, filter_id, msg_type, msg_text):
-        item = self._project_items.get(item_name) or self._connections.get(item_name)
-        self._event_message_arrived.emit(item, filter_id, msg_type, msg_text)
+        item = self._get_project_item(item_name) or self._get_connection(item_name)
+        self._add_event_message(item, sys.intern(filter_id or ""), sys.intern(msg_type), msg_text)
 
     def _handle_node_execution_started(self, data):
         self._do_handle_node_execution_started(**data)
@@ -355,7 +594,7 @@ class SpineEngineWorker(QObject):
         """Starts item icon animation when executing forward."""
         item = self._project_items[item_name]
         self._executing_items.add(item)
-        self._node_execution_started.emit(item, direction)
+        self._node_execution_started.emit(self._get_icon_handles(item), direction)
 
     def _handle_node_execution_finished(self, data):
         self._do_handle_node_execution_finished(**data)
@@ -367,7 +606,7 @@ class SpineEngineWorker(QObject):
         self._executing_items.discard(item)
         # NOTE: A single item may seemingly finish multiple times
         # when the execution is stopped by user during filtered execution.
-        self._node_execution_finished.emit(item, direction, item_state)
+        self._node_execution_finished.emit(self._get_icon_handles(item), direction, item_state)
 
     def _handle_server_status_msg(self, data):
         if data["msg_type"] == "success":
@@ -380,13 +619,15 @@ class SpineEngineWorker(QObject):
             self._logger.msg_warning.emit(data["text"])
 
     def clean_up(self):
+        self._flush_persistent_output()
         for item in self._executing_items:
-            self._node_execution_finished.emit(item, None, None)
-        if isinstance(self._engine_mngr, LocalSpineEngineManager):
+            self._node_execution_finished.emit(self._get_icon_handles(item), None, None)
+        if not self._exec_remotely:
             self._engine_mngr.stop_engine()
         else:
             self._engine_mngr.clean_up()
         self._thread.quit()
         self._thread.wait()
         self._thread.deleteLater()
+        self._prompt_handler.clean_up()
         self.deleteLater()
@@ -48,8 +48,6 @@ class Ui_TimeSeriesFixedResolutionEditor(object):
 
         self.formLayout.setWidget(0, QFormLayout.LabelRole, self.start_time_label)
 
-        self.verticalLayout_2 = QVBoxLayout()
-        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
         self.horizontalLayout = QHBoxLayout()
         self.horizontalLayout.setObjectName(u"horizontalLayout")
         self.start_time_edit = QLineEdit(self.verticalLayoutWidget)
@@ -63,35 +61,27 @@ class Ui_TimeSeriesFixedResolutionEditor(object):
         self.horizontalLayout.addWidget(self.calendar_button)
 
 
-        self.verticalLayout_2.addLayout(self.horizontalLayout)
+        self.formLayout.setLayout(0, QFormLayout.FieldRole, self.horizontalLayout)
 
         self.start_time_format_label = QLabel(self.verticalLayoutWidget)
         self.start_time_format_label.setObjectName(u"start_time_format_label")
 
-        self.verticalLayout_2.addWidget(self.start_time_format_label)
-
-
-        self.formLayout.setLayout(0, QFormLayout.FieldRole, self.verticalLayout_2)
+        self.formLayout.setWidget(1, QFormLayout.FieldRole, self.start_time_format_label)
 
         self.resolution_label = QLabel(self.verticalLayoutWidget)
         self.resolution_label.setObjectName(u"resolution_label")
 
-        self.formLayout.setWidget(1, QFormLayout.LabelRole, self.resolution_label)
+        self.formLayout.setWidget(2, QFormLayout.LabelRole, self.resolution_label)
 
-        self.verticalLayout_3 = QVBoxLayout()
-        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
         self.resolution_edit = QLineEdit(self.verticalLayoutWidget)
         self.resolution_edit.setObjectName(u"resolution_edit")
 
-        self.verticalLayout_3.addWidget(self.resolution_edit)
+        self.formLayout.setWidget(2, QFormLayout.FieldRole, self.resolution_edit)
 
         self.resolution_format_label = QLabel(self.verticalLayoutWidget)
         self.resolution_format_label.setObjectName(u"resolution_format_label")
 
-        self.verticalLayout_3.addWidget(self.resolution_format_label)
-
-
-        self.formLayout.setLayout(1, QFormLayout.FieldRole, self.verticalLayout_3)
+        self.formLayout.setWidget(3, QFormLayout.FieldRole, self.resolution_format_label)
 
 
         self.left_layout.addLayout(self.formLayout)
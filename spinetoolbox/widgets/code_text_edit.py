@@ -16,14 +16,12 @@ Provides simple text editor for programming purposes.
 :date:   28.1.2020
 """
 
-from pygments.styles import get_style_by_name
-from pygments.lexers import get_lexer_by_name
 from pygments.util import ClassNotFound
 from pygments.token import Token
 from PySide2.QtWidgets import QWidget, QPlainTextEdit, QPlainTextDocumentLayout
 from PySide2.QtGui import QColor, QFontMetrics, QFontDatabase, QPainter, QTextDocument
 from PySide2.QtCore import QSize, Slot, QRect, Qt
-from spinetoolbox.helpers import CustomSyntaxHighlighter
+from spinetoolbox.helpers import CustomSyntaxHighlighter, lexer_by_name, style_by_name
 
 
 class CodeTextEdit(QPlainTextEdit):
@@ -32,7 +30,7 @@ class CodeTextEdit(QPlainTextEdit):
     def __init__(self, *arg, **kwargs):
         super().__init__(*arg, **kwargs)
         self._highlighter = CustomSyntaxHighlighter(self)
-        self._style = get_style_by_name("monokai")
+        self._style = style_by_name("monokai")
         self._highlighter.set_style(self._style)
         self._line_number_area = LineNumberArea(self)
         self._right_margin = 16
@@ -54,7 +52,7 @@ class CodeTextEdit(QPlainTextEdit):
 
     def set_lexer_name(self, lexer_name):
         try:
-            self._highlighter.lexer = get_lexer_by_name(lexer_name)
+            self._highlighter.lexer = lexer_by_name(lexer_name)
             self._highlighter.rehighlight()
         except ClassNotFound:
             # No lexer for aliases 'gams' nor 'executable'
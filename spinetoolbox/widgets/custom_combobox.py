@@ -17,7 +17,7 @@ A widget for presenting basic information about the application.
 """
 
 import os
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, QEvent
 from PySide2.QtWidgets import QComboBox, QStyle, QStylePainter, QStyleOptionComboBox, QDialog, QAbstractItemView
 from PySide2.QtGui import QValidator
 from .notification import Notification
@@ -26,6 +26,19 @@ from .notification import Notification
 class ElidedCombobox(QComboBox):
     """Combobox with elided text."""
 
+    def __init__(self, parent=None):
+        """
+        Args:
+            parent (QWidget, optional): parent widget
+        """
+        super().__init__(parent)
+        self._elide_cache = (None, 0, None)  # (text, width, elided text)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self._elide_cache = (None, 0, None)
+        super().changeEvent(event)
+
     def paintEvent(self, event):
         opt = QStyleOptionComboBox()
         self.initStyleOption(opt)
@@ -33,7 +46,14 @@ class ElidedCombobox(QComboBox):
         p.drawComplexControl(QStyle.CC_ComboBox, opt)
 
         text_rect = self.style().subControlRect(QStyle.CC_ComboBox, opt, QStyle.SC_ComboBoxEditField, self)
-        opt.currentText = p.fontMetrics().elidedText(opt.currentText, Qt.ElideLeft, text_rect.width())
+        width = text_rect.width()
+        if width <= 0:
+            return
+        cached_text, cached_width, elided = self._elide_cache
+        if cached_text != opt.currentText or cached_width != width:
+            elided = p.fontMetrics().elidedText(opt.currentText, Qt.ElideLeft, width)
+            self._elide_cache = (opt.currentText, width, elided)
+        opt.currentText = elided
         p.drawControl(QStyle.CE_ComboBoxLabel, opt)
 
 
@@ -50,13 +70,14 @@ class OpenProjectDialogComboBox(QComboBox):
         if e.key() == Qt.Key_Enter or e.key() == Qt.Key_Return:
             state = self.validator().state
             fm_current_index = parent.ui.treeView_file_system.currentIndex()
+            selection = parent.selection()  # Already an absolute path
             if state == QValidator.Intermediate:
                 # Remove path from qsettings
                 # This is done because pressing enter adds an entry to combobox drop-down list automatically
                 # and we don't want to clog it with irrelevant paths
-                parent.remove_directory_from_recents(os.path.abspath(parent.selection()), parent._toolbox.qsettings())
+                parent.remove_directory_from_recents(selection, parent._toolbox.qsettings())
                 # Remove path from combobox as well
-                cb_index = self.findText(os.path.abspath(parent.selection()))
+                cb_index = self.findText(selection)
                 if cb_index == -1:
                     pass
                 else:
@@ -72,7 +93,7 @@ class OpenProjectDialogComboBox(QComboBox):
                     parent.ui.treeView_file_system.expand(fm_index)
                     parent.ui.treeView_file_system.scrollTo(fm_index, hint=QAbstractItemView.PositionAtTop)
                 else:
-                    project_json_fp = os.path.abspath(os.path.join(parent.selection(), ".spinetoolbox", "project.json"))
+                    project_json_fp = os.path.join(selection, ".spinetoolbox", "project.json")
                     if os.path.isfile(project_json_fp):
                         parent.done(QDialog.Accepted)
             else:
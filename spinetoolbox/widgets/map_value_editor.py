@@ -36,13 +36,13 @@ class MapValueEditor(ParameterValueEditorBase):
             parent (QWidget, optional): a parent widget
         """
         editors = {
-            ValueType.PLAIN_VALUE: PlainParameterValueEditor(),
-            ValueType.TIME_SERIES_FIXED_RESOLUTION: TimeSeriesFixedResolutionEditor(),
-            ValueType.TIME_SERIES_VARIABLE_RESOLUTION: TimeSeriesVariableResolutionEditor(),
-            ValueType.TIME_PATTERN: TimePatternEditor(),
-            ValueType.ARRAY: ArrayEditor(),
-            ValueType.DATETIME: DatetimeEditor(),
-            ValueType.DURATION: DurationEditor(),
+            ValueType.PLAIN_VALUE: PlainParameterValueEditor,
+            ValueType.TIME_SERIES_FIXED_RESOLUTION: TimeSeriesFixedResolutionEditor,
+            ValueType.TIME_SERIES_VARIABLE_RESOLUTION: TimeSeriesVariableResolutionEditor,
+            ValueType.TIME_PATTERN: TimePatternEditor,
+            ValueType.ARRAY: ArrayEditor,
+            ValueType.DATETIME: DatetimeEditor,
+            ValueType.DURATION: DurationEditor,
         }
 
         super().__init__(index, editors, parent)
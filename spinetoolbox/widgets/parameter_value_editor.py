@@ -39,17 +39,17 @@ class ParameterValueEditor(ParameterValueEditorBase):
             parent (QWidget, optional): a parent widget
             plain (bool): if True, allow only plain value editing, otherwise allow all parameter types
         """
-        editors = {ValueType.PLAIN_VALUE: PlainParameterValueEditor()}
+        editors = {ValueType.PLAIN_VALUE: PlainParameterValueEditor}
         if not plain:
             editors.update(
                 {
-                    ValueType.MAP: MapEditor(),
-                    ValueType.TIME_SERIES_FIXED_RESOLUTION: TimeSeriesFixedResolutionEditor(),
-                    ValueType.TIME_SERIES_VARIABLE_RESOLUTION: TimeSeriesVariableResolutionEditor(),
-                    ValueType.TIME_PATTERN: TimePatternEditor(),
-                    ValueType.ARRAY: ArrayEditor(),
-                    ValueType.DATETIME: DatetimeEditor(),
-                    ValueType.DURATION: DurationEditor(),
+                    ValueType.MAP: MapEditor,
+                    ValueType.TIME_SERIES_FIXED_RESOLUTION: TimeSeriesFixedResolutionEditor,
+                    ValueType.TIME_SERIES_VARIABLE_RESOLUTION: TimeSeriesVariableResolutionEditor,
+                    ValueType.TIME_PATTERN: TimePatternEditor,
+                    ValueType.ARRAY: ArrayEditor,
+                    ValueType.DATETIME: DatetimeEditor,
+                    ValueType.DURATION: DurationEditor,
                 }
             )
         super().__init__(index, editors, parent)
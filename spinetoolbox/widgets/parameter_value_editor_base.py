@@ -69,11 +69,12 @@ class ParameterValueEditorBase(QWidget):
     written back to the given index.
     """
 
-    def __init__(self, index, editor_widgets, parent=None):
+    def __init__(self, index, editor_factories, parent=None):
         """
         Args:
             index (QModelIndex): an index to a parameter_value in parent_model
-            editor_widgets (dict): a mapping from :class:`ValueType` to :class:`QWidget`
+            editor_factories (dict): a mapping from :class:`ValueType` to a callable that creates the editor widget;
+                editors are created when they are shown for the first time
             parent (QWidget, optional): a parent widget
         """
         from ..ui.parameter_value_editor import Ui_ParameterValueEditor  # pylint: disable=import-outside-toplevel
@@ -81,11 +82,13 @@ class ParameterValueEditorBase(QWidget):
         super().__init__(parent, f=Qt.Window)
         self.setAttribute(Qt.WA_DeleteOnClose)
         self._index = index
-        self._editors = editor_widgets
-        self._editor_indexes = {value_type: i for i, value_type in enumerate(editor_widgets)}
+        self._editor_factories = editor_factories
+        self._editors = {}
+        self._value_types = list(editor_factories)
+        self._editor_indexes = {value_type: i for i, value_type in enumerate(editor_factories)}
         self._ui = Ui_ParameterValueEditor()
         self._ui.setupUi(self)
-        self._ui.parameter_type_selector.addItems([_SELECTORS[value_type] for value_type in editor_widgets])
+        self._ui.parameter_type_selector.addItems([_SELECTORS[value_type] for value_type in editor_factories])
         self._ui.parameter_type_selector.currentIndexChanged.connect(self._change_parameter_type)
         self.addAction(self._ui.accept_action)
         self.addAction(self._ui.reject_action)
@@ -93,8 +96,40 @@ class ParameterValueEditorBase(QWidget):
         self._ui.reject_action.triggered.connect(self.close)
         self._ui.button_box.accepted.connect(self._ui.accept_action.trigger)
         self._ui.button_box.rejected.connect(self._ui.reject_action.trigger)
-        for widget in self._editors.values():
-            self._ui.editor_stack.addWidget(widget)
+        for _ in editor_factories:
+            self._ui.editor_stack.addWidget(QWidget())
+
+    def _editor(self, value_type):
+        """Returns the editor widget for given value type, creating it if needed.
+
+        Args:
+            value_type (ValueType): value type
+
+        Returns:
+            QWidget: editor widget
+        """
+        editor = self._editors.get(value_type)
+        if editor is None:
+            editor = self._editors[value_type] = self._editor_factories[value_type]()
+            index = self._editor_indexes[value_type]
+            placeholder = self._ui.editor_stack.widget(index)
+            self._ui.editor_stack.insertWidget(index, editor)
+            self._ui.editor_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+        return editor
+
+    def _show_editor(self, value_type):
+        """Makes the editor for given value type the current one in the editor stack.
+
+        Args:
+            value_type (ValueType): value type
+
+        Returns:
+            QWidget: editor widget
+        """
+        editor = self._editor(value_type)
+        self._ui.editor_stack.setCurrentWidget(editor)
+        return editor
 
     @Slot()
     def accept(self):
@@ -125,18 +160,18 @@ class ParameterValueEditorBase(QWidget):
             selector_index == self._editor_indexes[ValueType.TIME_SERIES_VARIABLE_RESOLUTION]
             and old_index == self._editor_indexes[ValueType.TIME_SERIES_FIXED_RESOLUTION]
         ):
-            fixed_resolution_value = self._editors[ValueType.TIME_SERIES_FIXED_RESOLUTION].value()
+            fixed_resolution_value = self._editor(ValueType.TIME_SERIES_FIXED_RESOLUTION).value()
             stamps = fixed_resolution_value.indexes
             values = fixed_resolution_value.values
             variable_resolution_value = TimeSeriesVariableResolution(
                 stamps, values, fixed_resolution_value.ignore_year, fixed_resolution_value.repeat
             )
-            self._editors[ValueType.TIME_SERIES_VARIABLE_RESOLUTION].set_value(variable_resolution_value)
+            self._editor(ValueType.TIME_SERIES_VARIABLE_RESOLUTION).set_value(variable_resolution_value)
         elif (
             selector_index == self._editor_indexes[ValueType.TIME_SERIES_FIXED_RESOLUTION]
             and old_index == self._editor_indexes[ValueType.TIME_SERIES_VARIABLE_RESOLUTION]
         ):
-            variable_resolution_value = self._editors[ValueType.TIME_SERIES_VARIABLE_RESOLUTION].value()
+            variable_resolution_value = self._editor(ValueType.TIME_SERIES_VARIABLE_RESOLUTION).value()
             stamps = variable_resolution_value.indexes
             start = stamps[0]
             difference = stamps[1] - start
@@ -148,10 +183,10 @@ class ParameterValueEditorBase(QWidget):
                 variable_resolution_value.ignore_year,
                 variable_resolution_value.repeat,
             )
-            self._editors[ValueType.TIME_SERIES_FIXED_RESOLUTION].set_value(fixed_resolution_value)
-        self._ui.editor_stack.setCurrentIndex(selector_index)
+            self._editor(ValueType.TIME_SERIES_FIXED_RESOLUTION).set_value(fixed_resolution_value)
+        editor = self._show_editor(self._value_types[selector_index])
         if selector_index == self._editor_indexes[ValueType.PLAIN_VALUE]:
-            self._editors[ValueType.PLAIN_VALUE].set_value("")
+            editor.set_value("")
 
     def _select_editor(self, value):
         """Shows the editor widget corresponding to the given value type on the editor stack."""
@@ -185,7 +220,7 @@ class ParameterValueEditorBase(QWidget):
         if message is not None:
             QMessageBox.warning(self.parent(), "Warning", message)
         self._ui.parameter_type_selector.setCurrentIndex(self._editor_indexes[ValueType.PLAIN_VALUE])
-        self._ui.editor_stack.setCurrentIndex(self._editor_indexes[ValueType.PLAIN_VALUE])
+        self._show_editor(ValueType.PLAIN_VALUE)
 
     def _use_editor(self, value, value_type):
         """
@@ -196,8 +231,7 @@ class ParameterValueEditorBase(QWidget):
             value_type (ValueType): type of value
         """
         self._ui.parameter_type_selector.setCurrentIndex(self._editor_indexes[value_type])
-        self._ui.editor_stack.setCurrentIndex(self._editor_indexes[value_type])
-        self._editors[value_type].set_value(value)
+        self._show_editor(value_type).set_value(value)
 
     def _set_data(self, value):
         """
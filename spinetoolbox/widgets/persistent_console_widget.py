@@ -9,10 +9,9 @@
 # this program. If not, see <http://www.gnu.org/licenses/>.
 ######################################################################################################################
 
+import functools
 import os
 import uuid
-from pygments.styles import get_style_by_name
-from pygments.lexers import get_lexer_by_name
 from pygments.util import ClassNotFound
 from pygments.token import Token
 from PySide2.QtCore import Qt, Slot, QTimer, Signal, QRect, QSize
@@ -27,12 +26,36 @@ from PySide2.QtGui import (
     QTextOption,
     QKeySequence,
 )
-from spinetoolbox.helpers import CustomSyntaxHighlighter
+from spinetoolbox.helpers import CustomSyntaxHighlighter, lexer_by_name, style_by_name
 from spinetoolbox.spine_engine_manager import make_engine_manager
 from spinetoolbox.server.engine_client import RemoteEngineInitFailed
 from spinetoolbox.qthread_pool_executor import QtBasedThreadPoolExecutor
 
 
+@functools.lru_cache(maxsize=None)
+def _prompt_for_language(language):
+    """Returns prompt and its text format for given language.
+
+    The format is shared between consoles and must not be modified.
+
+    Args:
+        language (str): console language
+
+    Returns:
+        tuple: prompt (str) and its format (QTextCharFormat)
+    """
+    text_format = QTextCharFormat()
+    if language == "julia":
+        prompt = "\njulia> "
+        text_format.setForeground(Qt.darkGreen)
+        text_format.setFontWeight(QFont.Bold)
+    elif language == "python":
+        prompt = ">>> "
+    else:
+        prompt = "$ "
+    return prompt, text_format
+
+
 class _CustomLineEdit(QPlainTextEdit):
     def __init__(self, console):
         super().__init__(console)
@@ -89,6 +112,8 @@ class _CustomLineEdit(QPlainTextEdit):
             return
         self._updating = True
         cursor = self.textCursor()
+        # One edit block so that a multi-line paste emits textChanged once instead of once per indented line.
+        cursor.beginEditBlock()
         for i in range(self.document().blockCount()):
             block = self.document().findBlockByNumber(i)
             if block.position() < self.min_pos:
@@ -96,6 +121,7 @@ class _CustomLineEdit(QPlainTextEdit):
             if not block.text().startswith(self.new_line_indent * " "):
                 cursor.setPosition(block.position())
                 cursor.insertText(self.new_line_indent * " ")
+        cursor.endEditBlock()
         self._updating = False
 
     @Slot()
@@ -148,7 +174,7 @@ class _CustomLineEdit(QPlainTextEdit):
 class PersistentConsoleWidget(QPlainTextEdit):
     """A widget to interact with a persistent process."""
 
-    _command_checked = Signal(str, bool)
+    _command_checked = Signal(str, bool, bool)
     _msg_available = Signal(str, str)
     _command_finished = Signal()
     _history_item_available = Signal(str, str)
@@ -157,7 +183,7 @@ class PersistentConsoleWidget(QPlainTextEdit):
     _flush_needed = Signal()
     _FLUSH_INTERVAL = 200
     _MAX_LINES_PER_SECOND = 2000
-    _MAX_LINES_PER_CYCLE = _MAX_LINES_PER_SECOND * 1000 / _FLUSH_INTERVAL
+    _MAX_LINES_PER_CYCLE = _MAX_LINES_PER_SECOND * _FLUSH_INTERVAL // 1000
     _MAX_LINES_COUNT = 2000
 
     def __init__(self, toolbox, key, language, owner=None):
@@ -184,7 +210,7 @@ class PersistentConsoleWidget(QPlainTextEdit):
         self._text_buffer = []
         self._skipped = {}
         self._anchor = None
-        self._style = get_style_by_name("monokai")
+        self._style = style_by_name("monokai")
         background_color = self._style.background_color
         foreground_color = self._style.styles[Token] or self._style.styles[Token.Text]
         self.setStyleSheet(
@@ -201,7 +227,7 @@ class PersistentConsoleWidget(QPlainTextEdit):
         self._highlighter = CustomSyntaxHighlighter(None)
         self._highlighter.set_style(self._style)
         try:
-            self._highlighter.lexer = get_lexer_by_name(self._language)
+            self._highlighter.lexer = lexer_by_name(self._language)
         except ClassNotFound:
             pass
         self._ansi_esc_code_handler = AnsiEscapeCodeHandler(foreground_color, background_color)
@@ -215,6 +241,8 @@ class PersistentConsoleWidget(QPlainTextEdit):
         self._flush_timer.timeout.connect(self._flush_text_buffer)
         self._flush_timer.setSingleShot(True)
         self.engine_mngr = None
+        self._engine_server_settings = None
+        self._local_engine_mngr = None
         self.setReadOnly(True)
         self.document().contentsChanged.connect(self._handle_contents_changed)
         self.updateRequest.connect(self._handle_update_request)
@@ -274,8 +302,7 @@ class PersistentConsoleWidget(QPlainTextEdit):
         cursor.select(cursor.BlockUnderCursor)
         cursor.removeSelectedText()
         cursor.beginEditBlock()
-        while text_buffer:
-            text, with_prompt = text_buffer.pop(0)
+        for text, with_prompt in text_buffer:
             self._insert_text(cursor, text, with_prompt)
         cursor.endEditBlock()
         self._anchor = None
@@ -340,8 +367,10 @@ class PersistentConsoleWidget(QPlainTextEdit):
         cursor.setPosition(self._input_start_pos)
         cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
         text = self._line_edit.raw_text()
-        cursor.insertText(text)
-        self._highlight_current_input()
+        cursor.beginEditBlock()
+        cursor.removeSelectedText()
+        self._insert_highlighted_input(cursor, text)
+        cursor.endEditBlock()
         self._updating = False
 
     @Slot()
@@ -351,40 +380,46 @@ class PersistentConsoleWidget(QPlainTextEdit):
     @Slot()
     def _flush_text_buffer(self):
         """Inserts all text from buffer."""
+        text_buffer = self._text_buffer
+        self._text_buffer = []
+        skipped = text_buffer[self._MAX_LINES_PER_CYCLE :]
         cursor = self.textCursor()
         cursor.beginEditBlock()
-        k = 0
-        while self._text_buffer and k < self._MAX_LINES_PER_CYCLE:
+        for text, with_prompt in text_buffer[: self._MAX_LINES_PER_CYCLE]:
             cursor.setPosition(self._prompt_block.position() - 1)
-            text, with_prompt = self._text_buffer.pop(0)
             self._insert_text(cursor, text, with_prompt)
-            k += 1
-        if self._text_buffer:
+        if skipped:
             address = uuid.uuid4().hex
             char_format = cursor.charFormat()
             char_format.setBackground(QColor('white'))
             char_format.setForeground(QColor('blue'))
             char_format.setAnchor(True)
             char_format.setAnchorHref(address)
-            self._skipped[address] = self._text_buffer[-self._MAX_LINES_COUNT :]
+            self._skipped[address] = skipped[-self._MAX_LINES_COUNT :]
             cursor.setPosition(self._prompt_block.position() - 1)
             cursor.insertBlock(QTextBlockFormat())
-            cursor.insertText(f"<--- {len(self._text_buffer)} more lines --->", char_format)
-            self._text_buffer.clear()
+            cursor.insertText(f"<--- {len(skipped)} more lines --->", char_format)
         cursor.endEditBlock()
+        if skipped:
+            # Maximum block count is enforced only after the edit block ends.
+            self._forget_unreachable_skipped_lines()
         self._flush_in_progress = False
 
+    def _forget_unreachable_skipped_lines(self):
+        """Drops skipped lines whose anchors have been pushed out of the document."""
+        addresses = set()
+        block = self.document().firstBlock()
+        while block.isValid():
+            for format_range in block.textFormats():
+                if format_range.format.isAnchor():
+                    addresses.add(format_range.format.anchorHref())
+            block = block.next()
+        for address in list(self._skipped):
+            if address not in addresses:
+                del self._skipped[address]
+
     def _make_prompt(self):
-        text_format = QTextCharFormat()
-        if self._language == "julia":
-            prompt = "\njulia> "
-            text_format.setForeground(Qt.darkGreen)
-            text_format.setFontWeight(QFont.Bold)
-        elif self._language == "python":
-            prompt = ">>> "
-        else:
-            prompt = "$ "
-        return prompt, text_format
+        return _prompt_for_language(self._language)
 
     def _make_prompt_block(self, prompt=""):
         cursor = self.textCursor()
@@ -486,18 +521,18 @@ class PersistentConsoleWidget(QPlainTextEdit):
         le_cursor.setPosition(self._line_edit.min_pos, QTextCursor.KeepAnchor)
         return le_cursor.selectedText().rstrip()
 
-    def _highlight_current_input(self):
-        cursor = self.textCursor()
-        cursor.setPosition(self._input_start_pos)
-        cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
-        text = cursor.selectedText()
+    def _insert_highlighted_input(self, cursor, text):
+        """Inserts user input with syntax highlighting already applied.
+
+        Args:
+            cursor (QTextCursor): cursor at input start position
+            text (str): user input
+        """
+        if self._highlighter.lexer is None:
+            cursor.insertText(text)
+            return
         for start, count, text_format in self._highlighter.yield_formats(text):
-            start += self._input_start_pos
-            cursor.setPosition(start)
-            cursor.setPosition(start + count, QTextCursor.KeepAnchor)
-            cursor.setCharFormat(text_format)
-        cursor.movePosition(QTextCursor.NextCharacter)
-        cursor.setCharFormat(QTextCharFormat())
+            cursor.insertText(text[start : start + count], text_format)
 
     def key_press_event(self, ev):
         """Handles key press event from line edit.
@@ -506,38 +541,56 @@ class PersistentConsoleWidget(QPlainTextEdit):
             True if handled, False if not.
         """
         self._at_bottom = True
-        text = self._get_current_text()
-        if ev.key() in (Qt.Key_Return, Qt.Key_Enter):
-            self._issue_command(text)
-        elif ev.key() == Qt.Key_Up:
-            self._move_history(text, True)
-        elif ev.key() == Qt.Key_Down:
-            self._move_history(text, False)
-        elif ev.key() == Qt.Key_Tab:
-            self._autocomplete(text)
+        key = ev.key()
+        if key in (Qt.Key_Return, Qt.Key_Enter):
+            self._issue_command(self._get_current_text())
+        elif key == Qt.Key_Up:
+            self._move_history(self._get_current_text(), True)
+        elif key == Qt.Key_Down:
+            self._move_history(self._get_current_text(), False)
+        elif key == Qt.Key_Tab:
+            self._autocomplete(self._get_current_text())
         else:
             return False
         return True
 
-    def create_engine_manager(self):
-        """Returns a new local or remote spine engine manager or
-        an existing remote spine engine manager.
-        Returns None if connecting to Spine Engine Server fails."""
-        exec_remotely = self._toolbox.qsettings().value("engineSettings/remoteExecutionEnabled", "false") == "true"
+    def _exec_remotely(self):
+        """Reads the remote execution setting. Call in the GUI thread and pass the result on to the executor.
+
+        Returns:
+            bool: True if remote execution is enabled
+        """
+        return self._toolbox.qsettings().value("engineSettings/remoteExecutionEnabled", "false") == "true"
+
+    def create_engine_manager(self, exec_remotely):
+        """Returns a local or a remote spine engine manager.
+        Both are created on first request and reused afterwards;
+        the remote one is recreated if Spine Engine Server settings have changed.
+        Returns None if connecting to Spine Engine Server fails.
+
+        Args:
+            exec_remotely (bool): True to get a remote engine manager, False to get a local one
+        """
         if exec_remotely:
-            if self.engine_mngr:
-                return self.engine_mngr
+            server_settings = self._toolbox.engine_server_settings()
+            if self.engine_mngr is not None:
+                if server_settings == self._engine_server_settings:
+                    return self.engine_mngr
+                self.engine_mngr.engine_client.close()
             self.engine_mngr = make_engine_manager(exec_remotely)
-            host, port, security, sec_folder = self._toolbox.engine_server_settings()
             try:
-                self.engine_mngr.make_engine_client(host, port, security, sec_folder)
+                self.engine_mngr.make_engine_client(*server_settings)
             except RemoteEngineInitFailed as e:
+                self.engine_mngr = None
+                self._engine_server_settings = None
                 self._toolbox.msg_error.emit(f"Connecting to Spine Engine Server failed. {e}")
                 return None
+            self._engine_server_settings = server_settings
             return self.engine_mngr
         else:
-            engine_mngr = make_engine_manager(exec_remotely)
-            return engine_mngr
+            if self._local_engine_mngr is None:
+                self._local_engine_mngr = make_engine_manager(exec_remotely)
+            return self._local_engine_mngr
 
     def _issue_command(self, text):
         """Issues command.
@@ -545,33 +598,35 @@ class PersistentConsoleWidget(QPlainTextEdit):
         Args:
             text (str)
         """
-        self._executor.submit(self._do_check_command, text)
+        self._executor.submit(self._do_check_command, text, self._exec_remotely())
 
-    def _do_check_command(self, text):
+    def _do_check_command(self, text, exec_remotely):
         if not text.strip():  # Don't send empty command to execution manager
             self._make_prompt_block(prompt=self._prompt)
             return
-        engine_mngr = self.create_engine_manager()
+        engine_mngr = self.create_engine_manager(exec_remotely)
         if not engine_mngr:
             return
         complete = engine_mngr.is_persistent_command_complete(self._key, text)
-        self._command_checked.emit(text, complete)
+        self._command_checked.emit(text, complete, exec_remotely)
 
-    @Slot(str, bool)
-    def _handle_command_checked(self, text, complete):
+    @Slot(str, bool, bool)
+    def _handle_command_checked(self, text, complete, exec_remotely):
         """Issues command.
 
         Args:
             text (str)
+            complete (bool): True if command is complete
+            exec_remotely (bool): True if command should be issued to a remote engine
         """
         if not complete:
             self._line_edit.new_line()
             return
         self._make_prompt_block(prompt="")
-        self._executor.submit(self._do_issue_command, text)
+        self._executor.submit(self._do_issue_command, text, exec_remotely)
 
-    def _do_issue_command(self, text):
-        engine_mngr = self.create_engine_manager()
+    def _do_issue_command(self, text, exec_remotely):
+        engine_mngr = self.create_engine_manager(exec_remotely)
         if not engine_mngr:
             return
         log_stdin = bool(self._pending_command_count)
@@ -598,10 +653,10 @@ class PersistentConsoleWidget(QPlainTextEdit):
 
     def _move_history(self, text, backwards):
         """Moves history."""
-        self._executor.submit(self._do_move_history, text, backwards)
+        self._executor.submit(self._do_move_history, text, backwards, self._exec_remotely())
 
-    def _do_move_history(self, text, backwards):
-        engine_mngr = self.create_engine_manager()
+    def _do_move_history(self, text, backwards, exec_remotely):
+        engine_mngr = self.create_engine_manager(exec_remotely)
         if not engine_mngr:
             return
         prefix = self._get_prefix()
@@ -628,10 +683,10 @@ class PersistentConsoleWidget(QPlainTextEdit):
             le_cursor.insertText(4 * " ")
             self._line_edit.setTextCursor(le_cursor)
             return
-        self._executor.submit(self._do_autocomplete, text)
+        self._executor.submit(self._do_autocomplete, text, self._exec_remotely())
 
-    def _do_autocomplete(self, text):
-        engine_mngr = self.create_engine_manager()
+    def _do_autocomplete(self, text, exec_remotely):
+        engine_mngr = self.create_engine_manager(exec_remotely)
         if not engine_mngr:
             return
         prefix = self._get_prefix()
@@ -667,10 +722,11 @@ class PersistentConsoleWidget(QPlainTextEdit):
         self._make_prompt_block("")
         self._updating = False
         self._text_buffer.clear()
-        self._executor.submit(self._do_restart_persistent)
+        self._skipped.clear()
+        self._executor.submit(self._do_restart_persistent, self._exec_remotely())
 
-    def _do_restart_persistent(self):
-        engine_mngr = self.create_engine_manager()
+    def _do_restart_persistent(self, exec_remotely):
+        engine_mngr = self.create_engine_manager(exec_remotely)
         if not engine_mngr:
             return
         for msg in engine_mngr.restart_persistent(self._key):
@@ -684,10 +740,10 @@ class PersistentConsoleWidget(QPlainTextEdit):
     @Slot(bool)
     def _interrupt_persistent(self, _=False):
         """Interrupts underlying persistent process."""
-        self._executor.submit(self._do_interrupt_persistent)
+        self._executor.submit(self._do_interrupt_persistent, self._exec_remotely())
 
-    def _do_interrupt_persistent(self):
-        engine_mngr = self.create_engine_manager()
+    def _do_interrupt_persistent(self, exec_remotely):
+        engine_mngr = self.create_engine_manager(exec_remotely)
         if not engine_mngr:
             return
         engine_mngr.interrupt_persistent(self._key)
@@ -713,6 +769,27 @@ class PersistentConsoleWidget(QPlainTextEdit):
 # Translated from
 # https://code.qt.io/cgit/qt-creator/qt-creator.git/tree/src/libs/utils/ansiescapecodehandler.cpp?h=master
 # TODO: Consider qtconsole's QtAnsiCodeProcessor
+class _AnsiEscapeCode:
+    ResetFormat = 0
+    BoldText = 1
+    FaintText = 2
+    ItalicText = 3
+    NormalIntensity = 22
+    NotItalic = 23
+    TextColorStart = 30
+    TextColorEnd = 37
+    RgbTextColor = 38
+    DefaultTextColor = 39
+    BackgroundColorStart = 40
+    BackgroundColorEnd = 47
+    RgbBackgroundColor = 48
+    DefaultBackgroundColor = 49
+    BrightTextColorStart = 90
+    BrightTextColorEnd = 97
+    BrightBackgroundColorStart = 100
+    BrightBackgroundColorEnd = 107
+
+
 class AnsiEscapeCodeHandler:
     def __init__(self, fg_color, bg_color):
         self._previous_format_closed = True
@@ -720,12 +797,13 @@ class AnsiEscapeCodeHandler:
         self._pending_text = ""
         self._bg_color = QColor(bg_color)
         self._fg_color = QColor(fg_color)
+        self._default_format = QTextCharFormat()
+        self._default_format.setBackground(self._bg_color)
+        self._default_format.setForeground(self._fg_color)
 
     def _make_default_format(self):
-        default_format = QTextCharFormat()
-        default_format.setBackground(self._bg_color)
-        default_format.setForeground(self._fg_color)
-        return default_format
+        # Copies are implicitly shared and detach only when the caller modifies them.
+        return QTextCharFormat(self._default_format)
 
     def endFormatScope(self):
         self._previous_format_closed = True
@@ -735,26 +813,6 @@ class AnsiEscapeCodeHandler:
         self._previous_format_closed = False
 
     def parse_text(self, text):
-        class AnsiEscapeCode:
-            ResetFormat = 0
-            BoldText = 1
-            FaintText = 2
-            ItalicText = 3
-            NormalIntensity = 22
-            NotItalic = 23
-            TextColorStart = 30
-            TextColorEnd = 37
-            RgbTextColor = 38
-            DefaultTextColor = 39
-            BackgroundColorStart = 40
-            BackgroundColorEnd = 47
-            RgbBackgroundColor = 48
-            DefaultBackgroundColor = 49
-            BrightTextColorStart = 90
-            BrightTextColorEnd = 97
-            BrightBackgroundColorStart = 100
-            BrightBackgroundColorEnd = 107
-
         escape = "\x1b["
         semicolon = ";"
         color_terminator = "m"
@@ -823,54 +881,54 @@ class AnsiEscapeCodeHandler:
                     self.endFormatScope()
                 for i in range(len(numbers)):  # pylint: disable=consider-using-enumerate
                     code = int(numbers[i])
-                    if AnsiEscapeCode.TextColorStart <= code <= AnsiEscapeCode.TextColorEnd:
-                        char_format.setForeground(_ansi_color(code - AnsiEscapeCode.TextColorStart))
+                    if _AnsiEscapeCode.TextColorStart <= code <= _AnsiEscapeCode.TextColorEnd:
+                        char_format.setForeground(_ansi_color(code - _AnsiEscapeCode.TextColorStart))
                         self.setFormatScope(char_format)
-                    elif AnsiEscapeCode.BrightTextColorStart <= code <= AnsiEscapeCode.BrightTextColorEnd:
-                        char_format.setForeground(_ansi_color(code - AnsiEscapeCode.BrightTextColorStart, bright=True))
+                    elif _AnsiEscapeCode.BrightTextColorStart <= code <= _AnsiEscapeCode.BrightTextColorEnd:
+                        char_format.setForeground(_ansi_color(code - _AnsiEscapeCode.BrightTextColorStart, bright=True))
                         self.setFormatScope(char_format)
-                    elif AnsiEscapeCode.BackgroundColorStart <= code <= AnsiEscapeCode.BackgroundColorEnd:
-                        char_format.setBackground(_ansi_color(code - AnsiEscapeCode.BackgroundColorStart))
+                    elif _AnsiEscapeCode.BackgroundColorStart <= code <= _AnsiEscapeCode.BackgroundColorEnd:
+                        char_format.setBackground(_ansi_color(code - _AnsiEscapeCode.BackgroundColorStart))
                         self.setFormatScope(char_format)
-                    elif AnsiEscapeCode.BrightBackgroundColorStart <= code <= AnsiEscapeCode.BrightBackgroundColorEnd:
+                    elif _AnsiEscapeCode.BrightBackgroundColorStart <= code <= _AnsiEscapeCode.BrightBackgroundColorEnd:
                         char_format.setBackground(
-                            _ansi_color(code - AnsiEscapeCode.BrightBackgroundColorStart, bright=True)
+                            _ansi_color(code - _AnsiEscapeCode.BrightBackgroundColorStart, bright=True)
                         )
                         self.setFormatScope(char_format)
                     else:
-                        if code == AnsiEscapeCode.ResetFormat:
+                        if code == _AnsiEscapeCode.ResetFormat:
                             char_format = self._make_default_format()
                             self.endFormatScope()
                             break
-                        if code == AnsiEscapeCode.BoldText:
+                        if code == _AnsiEscapeCode.BoldText:
                             char_format.setFontWeight(QFont.Bold)
                             self.setFormatScope(char_format)
                             break
-                        if code == AnsiEscapeCode.FaintText:
+                        if code == _AnsiEscapeCode.FaintText:
                             char_format.setFontWeight(QFont.Light)
                             self.setFormatScope(char_format)
                             break
-                        if code == AnsiEscapeCode.ItalicText:
+                        if code == _AnsiEscapeCode.ItalicText:
                             char_format.setFontItalic(True)
                             self.setFormatScope(char_format)
                             break
-                        if code == AnsiEscapeCode.NormalIntensity:
+                        if code == _AnsiEscapeCode.NormalIntensity:
                             char_format.setFontWeight(QFont.Normal)
                             self.setFormatScope(char_format)
                             break
-                        if code == AnsiEscapeCode.NotItalic:
+                        if code == _AnsiEscapeCode.NotItalic:
                             char_format.setFontItalic(False)
                             self.setFormatScope(char_format)
                             break
-                        if code == AnsiEscapeCode.DefaultTextColor:
+                        if code == _AnsiEscapeCode.DefaultTextColor:
                             char_format.setForeground(self._fg_color)
                             self.setFormatScope(char_format)
                             break
-                        if code == AnsiEscapeCode.DefaultBackgroundColor:
+                        if code == _AnsiEscapeCode.DefaultBackgroundColor:
                             char_format.setBackground(self._bg_color)
                             self.setFormatScope(char_format)
                             break
-                        if code == AnsiEscapeCode.RgbBackgroundColor:
+                        if code == _AnsiEscapeCode.RgbBackgroundColor:
                             # See http://en.wikipedia.org/wiki/ANSI_escape_code#Colors
                             i += 1
                             if i >= len(numbers):
@@ -880,7 +938,7 @@ class AnsiEscapeCodeHandler:
                                 # RGB set with format: 38;2;<r>;<g>;<b>
                                 if i + 3 < len(numbers):
                                     color = QColor(int(numbers[i + 1]), int(numbers[i + 2]), int(numbers[i + 3]))
-                                    if code == AnsiEscapeCode.RgbTextColor:
+                                    if code == _AnsiEscapeCode.RgbTextColor:
                                         char_format.setForeground(color)
                                     else:
                                         char_format.setBackground(color)
@@ -905,7 +963,7 @@ class AnsiEscapeCodeHandler:
                                     # The last 24 colors are a greyscale gradient.
                                     grey = int((index - 232) * 11)
                                     color = QColor(grey, grey, grey)
-                                if code == AnsiEscapeCode.RgbTextColor:
+                                if code == _AnsiEscapeCode.RgbTextColor:
                                     char_format.setForeground(color)
                                 else:
                                     char_format.setBackground(color)
@@ -22,7 +22,7 @@ import csv
 
 import numpy
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolBar
-from PySide2.QtCore import QMetaObject, Qt
+from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QVBoxLayout, QWidget, QMenu, QApplication
 from .plot_canvas import PlotCanvas, LegendPosition
 from .custom_qtableview import CopyPasteTableView
@@ -55,7 +55,6 @@ class PlotWidget(QWidget):
         self._layout.addWidget(self._toolbar)
         self._layout.addWidget(self.canvas)
         self.original_xy_data = list()
-        QMetaObject.connectSlotsByName(self)
 
     def closeEvent(self, event):
         """Removes the window from plot_windows and closes."""
@@ -34,6 +34,8 @@ class PropertiesWidgetBase(QWidget):
         self._transparent_classes = {QAbstractItemView, QLineEdit}
         self._non_transparent_classes = {QHeaderView}
         self._transparent_widgets = set()
+        self._watched_widgets = set()
+        self._children_changed = True
         if base_color is not None:
             self.set_color_and_icon(base_color)
 
@@ -52,17 +54,35 @@ class PropertiesWidgetBase(QWidget):
         self._pixmap.setMask(bnw_pixmap.createMaskFromColor(Qt.transparent))
 
     def eventFilter(self, obj, ev):
-        if ev.type() == QEvent.Paint:
+        if ev.type() == QEvent.ChildAdded:
+            if ev.child().isWidgetType():
+                # A widget was added somewhere below a direct child.
+                self._children_changed = True
+                self.update()
+        elif ev.type() == QEvent.Paint and obj in self._transparent_widgets:
             painter = QPainter(obj)
             painter.fillRect(obj.rect(), QColor(255, 255, 255, 180))
         return super().eventFilter(obj, ev)
 
-    def paintEvent(self, ev):
-        """Paints background"""
-        settings = self._toolbox.qsettings()
-        if settings.value("appSettings/colorPropertiesWidgets", defaultValue="false") == "false":
-            super().paintEvent(ev)
-            return
+    def childEvent(self, ev):
+        """Schedules a new transparency pass when child widgets are added."""
+        if ev.type() == QEvent.ChildAdded and ev.child().isWidgetType():
+            self._children_changed = True
+        super().childEvent(ev)
+
+    def showEvent(self, ev):
+        """Schedules a new transparency pass as contents may have been rebuilt while hidden."""
+        self._children_changed = True
+        super().showEvent(ev)
+
+    def _make_children_transparent(self):
+        """Makes new descendant widgets of transparent classes see-through
+        and watches all descendants for widgets added to them later."""
+        self._children_changed = False
+        for widget in self.findChildren(QWidget):
+            if widget not in self._watched_widgets:
+                self._watched_widgets.add(widget)
+                widget.installEventFilter(self)
         new_transparent_widgets = {
             widget
             for transparent in self._transparent_classes
@@ -73,11 +93,19 @@ class PropertiesWidgetBase(QWidget):
         self._transparent_widgets |= new_transparent_widgets
         for widget in new_transparent_widgets:
             widget.setAttribute(Qt.WA_NoSystemBackground)
-            widget.installEventFilter(self)
             try:
                 widget.viewport().setAttribute(Qt.WA_TranslucentBackground)
             except AttributeError:
                 pass
+
+    def paintEvent(self, ev):
+        """Paints background"""
+        settings = self._toolbox.qsettings()
+        if settings.value("appSettings/colorPropertiesWidgets", defaultValue="false") == "false":
+            super().paintEvent(ev)
+            return
+        if self._children_changed:
+            self._make_children_transparent()
         rect = self.rect()
         painter = QPainter(self)
         painter.fillRect(rect, self._bg_color)
@@ -89,10 +89,7 @@ class TimeSeriesFixedResolutionEditor(QWidget):
         self._ui.ignore_year_check_box.toggled.connect(self._model.set_ignore_year)
         self._ui.repeat_check_box.setChecked(self._model.value.repeat)
         self._ui.repeat_check_box.toggled.connect(self._model.set_repeat)
-        self._calendar = QCalendarWidget(self)
-        self._calendar.setMinimumDate(QDate(100, 1, 1))
-        self._calendar.setWindowFlags(Qt.Popup)
-        self._calendar.activated.connect(self._select_date)
+        self._calendar = None
         for i in range(self._ui.splitter.count()):
             self._ui.splitter.setCollapsible(i, False)
         self._update_plot()
@@ -135,18 +132,32 @@ class TimeSeriesFixedResolutionEditor(QWidget):
         self._ui.ignore_year_check_box.setChecked(self._model.value.ignore_year)
         self._ui.repeat_check_box.setChecked(self._model.value.repeat)
 
+    def _get_calendar(self):
+        """Returns the calendar popup, creating it on first use.
+
+        Returns:
+            QCalendarWidget: calendar
+        """
+        if self._calendar is None:
+            self._calendar = QCalendarWidget(self)
+            self._calendar.setMinimumDate(QDate(100, 1, 1))
+            self._calendar.setWindowFlags(Qt.Popup)
+            self._calendar.activated.connect(self._select_date)
+        return self._calendar
+
     @Slot()
     def _show_calendar(self):
+        calendar = self._get_calendar()
         start = self._model.value.start
         if start.year >= 100:
-            self._calendar.setSelectedDate(QDate(start.year, start.month, start.day))
+            calendar.setSelectedDate(QDate(start.year, start.month, start.day))
         else:
-            self._calendar.setSelectedDate(QDate.currentDate())
+            calendar.setSelectedDate(QDate.currentDate())
         button_position = self._ui.calendar_button.mapToGlobal(QPoint(0, 0))
         calendar_x = button_position.x()
         calendar_y = button_position.y() + self._ui.calendar_button.height()
-        self._calendar.move(calendar_x, calendar_y)
-        self._calendar.show()
+        calendar.move(calendar_x, calendar_y)
+        calendar.show()
 
     @Slot()
     def _start_time_changed(self):
@@ -322,6 +322,7 @@ class TestSpineDBManager(SpineDBManager):
 
     def can_fetch_more(self, db_map, parent):
         parent.add_item = lambda db_map, item: parent.handle_items_added({db_map: [item]})
+        parent.add_items = lambda db_map, items: parent.handle_items_added({db_map: items})
         parent.update_item = lambda db_map, item: parent.handle_items_updated({db_map: [item]})
         parent.remove_item = lambda db_map, item: parent.handle_items_removed({db_map: [item]})
         return super().can_fetch_more(db_map, parent)
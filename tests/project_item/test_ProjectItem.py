@@ -44,7 +44,7 @@ class TestProjectItem(unittest.TestCase):
 
     def test_notify_destination(self):
         item = ProjectItem("name", "description", 0.0, 0.0, self.project)
-        item.item_type = MagicMock(return_value="item_type")
+        item.item_type = lambda: "item_type"
         item.logger.msg_warning = MagicMock()
         item.notify_destination(item)
         item.logger.msg_warning.emit.assert_called_with(
@@ -56,11 +56,11 @@ class TestProjectItem(unittest.TestCase):
         project = MagicMock()
         project.items_dir = "item_directory/"
         item = ProjectItem("item name", "Item's description.", -2.3, 5.5, project)
-        item.item_type = MagicMock(return_value="item type")
+        item.item_type = lambda: "item type"
         icon = NonCallableMagicMock()
         icon.x.return_value = -2.3
         icon.y.return_value = 5.5
-        item.get_icon = MagicMock(return_value=icon)
+        item.get_icon = lambda: icon
         item_dict = item.item_dict()
         expected = {"type": "item type", "description": "Item's description.", "x": -2.3, "y": 5.5}
         self.assertEqual(item_dict, expected)
@@ -19,7 +19,7 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 import unittest
 from unittest.mock import MagicMock
-from PySide2.QtCore import Qt, QSettings
+from PySide2.QtCore import Qt, QObject, QSettings, Signal
 from PySide2.QtWidgets import QApplication
 from spinedb_api import (
     DatabaseMapping,
@@ -325,5 +325,39 @@ class TestOpenDBEditor(unittest.TestCase):
                 running = False
 
 
+class TestExport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            QApplication()
+
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        self._db_mngr = SpineDBManager(QSettings(), None)
+        self._caller = _ExportCaller()
+
+    def tearDown(self):
+        self._db_mngr.clean_up()
+        self._caller.deleteLater()
+        QApplication.processEvents()
+        self._temp_dir.cleanup()
+
+    def test_export_to_excel_emits_file_exported_and_cleans_up_worker(self):
+        file_path = str(Path(self._temp_dir.name, "export.xlsx"))
+        with signal_waiter(self._caller.file_exported) as waiter:
+            self._db_mngr.export_to_excel(file_path, {}, self._caller)
+            waiter.wait()
+            self.assertEqual(waiter.args, (file_path,))
+        while self._db_mngr._export_workers:
+            QApplication.processEvents()
+        self.assertTrue(Path(file_path).exists())
+
+
+class _ExportCaller(QObject):
+    msg_error = Signal(object)
+    file_exported = Signal(str)
+    sqlite_file_exported = Signal(str)
+
+
 if __name__ == '__main__':
     unittest.main()
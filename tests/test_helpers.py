@@ -38,6 +38,7 @@ from spinetoolbox.helpers import (
     format_string_list,
     get_datetime,
     interpret_icon_id,
+    lexer_by_name,
     load_specification_from_file,
     make_icon_id,
     recursive_overwrite,
@@ -221,6 +222,11 @@ class TestHelpers(unittest.TestCase):
     def test_format_string_list(self):
         self.assertEqual(format_string_list(["a", "b", "c"]), "<ul><li>a</li><li>b</li><li>c</li></ul>")
 
+    def test_lexer_by_name_reuses_lexer(self):
+        lexer = lexer_by_name("python")
+        self.assertEqual(lexer.name, "Python")
+        self.assertIs(lexer_by_name("python"), lexer)
+
     def test_row_to_row_count_tuples(self):
         self.assertEqual(rows_to_row_count_tuples([]), [])
         self.assertEqual(rows_to_row_count_tuples([1, 2, 3, 5, 6, 9]), [(1, 3), (5, 2), (9, 1)])
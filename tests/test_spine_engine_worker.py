@@ -17,7 +17,7 @@ Unit tests for ``spine_engine_worker`` module.
 """
 import time
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 from PySide2.QtCore import QObject, Slot
 from PySide2.QtWidgets import QApplication
 from spinetoolbox.spine_engine_worker import SpineEngineWorker
@@ -49,6 +49,44 @@ class TestSpineEngineWorker(unittest.TestCase):
         finally:
             receiver.deleteLater()
 
+    def test_log_messages_of_mixed_batch_keep_their_order(self):
+        logger = MagicMock()
+        item = MagicMock()
+        engine_data = {"items_module_name": "spine_items", "settings": {}}
+        worker = SpineEngineWorker(engine_data, MagicMock(), "test dag", {"T": item}, {}, logger, "123")
+        worker._connect_log_signals(silent=False)
+        events = [
+            (
+                "standard_execution_msg",
+                {"item_name": "T", "filter_id": "", "type": "execution_started", "program": "p", "args": "a"},
+            ),
+            ("process_msg", {"item_name": "T", "filter_id": "", "msg_type": "msg", "msg_text": "out 1"}),
+            ("process_msg", {"item_name": "T", "filter_id": "", "msg_type": "msg", "msg_text": "out 2"}),
+            ("event_msg", {"item_name": "T", "filter_id": "", "msg_type": "msg", "msg_text": "first"}),
+            ("event_msg", {"item_name": "T", "filter_id": "", "msg_type": "msg", "msg_text": "second"}),
+            ("process_msg", {"item_name": "T", "filter_id": "", "msg_type": "msg_error", "msg_text": "err"}),
+        ]
+        try:
+            self.assertFalse(worker._process_events(events))
+            QApplication.processEvents()
+            self.assertEqual(
+                item.mock_calls,
+                [
+                    call.add_event_message("", "msg", "\tStarting program <b>p</b>"),
+                    call.add_event_message("", "msg", "\tArguments: <b>a</b>"),
+                    call.add_event_message(
+                        "", "msg_warning", "\tExecution is in progress. See messages below (stdout&stderr)"
+                    ),
+                    call.add_process_message("", "msg", "out 1<br/>out 2"),
+                    call.add_event_message("", "msg", "first"),
+                    call.add_event_message("", "msg", "second"),
+                    call.add_process_message("", "msg_error", "err"),
+                ],
+            )
+        finally:
+            worker.thread().deleteLater()
+            worker.deleteLater()
+
 
 class _Receiver(QObject):
     def __init__(self, worker):
@@ -31,6 +31,7 @@ from spinedb_api import (
     to_database,
 )
 from spinetoolbox.widgets.parameter_value_editor import ParameterValueEditor
+from spinetoolbox.widgets.parameter_value_editor_base import ValueType
 
 
 class _MockParentModel(QAbstractTableModel):
@@ -111,6 +112,17 @@ class TestParameterValueEditor(unittest.TestCase):
         time_series = TimeSeriesVariableResolution(indexes, values, True, False)
         self._check_parent_model_updated_when_closed(time_series)
 
+    def test_only_shown_editor_gets_created(self):
+        model = _MockParentModel()
+        model_index = model.index(1, 1)
+        model.setData(model_index, 23.0)
+        editor = ParameterValueEditor(model_index)
+        self.assertEqual(list(editor._editors), [ValueType.PLAIN_VALUE])
+        editor._ui.parameter_type_selector.setCurrentIndex(editor._editor_indexes[ValueType.DURATION])
+        self.assertEqual(set(editor._editors), {ValueType.PLAIN_VALUE, ValueType.DURATION})
+        self.assertIs(editor._ui.editor_stack.currentWidget(), editor._editors[ValueType.DURATION])
+        editor.deleteLater()
+
 
 if __name__ == '__main__':
     unittest.main()
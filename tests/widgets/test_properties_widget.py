@@ -0,0 +1,51 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# This file is part of Spine Toolbox.
+# Spine Toolbox is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for the properties widget base class.
+"""
+import unittest
+from unittest.mock import MagicMock
+from PySide2.QtCore import Qt
+from PySide2.QtGui import QColor
+from PySide2.QtWidgets import QApplication, QLineEdit, QVBoxLayout, QWidget
+from spinetoolbox.widgets.properties_widget import PropertiesWidgetBase
+
+
+class TestPropertiesWidgetBase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            QApplication()
+
+    def setUp(self):
+        toolbox = MagicMock()
+        toolbox.qsettings.return_value.value.return_value = "true"
+        self._widget = PropertiesWidgetBase(toolbox, QColor(Qt.red))
+        self._container = QWidget(self._widget)
+        QVBoxLayout(self._widget).addWidget(self._container)
+        QVBoxLayout(self._container)
+
+    def tearDown(self):
+        self._widget.deleteLater()
+        QApplication.processEvents()
+
+    def test_widget_added_below_child_while_visible_becomes_transparent(self):
+        self._widget.show()
+        self._widget.repaint()
+        line_edit = QLineEdit(self._container)
+        self._container.layout().addWidget(line_edit)
+        self._widget.repaint()
+        self.assertTrue(line_edit.testAttribute(Qt.WA_NoSystemBackground))
+
+
+if __name__ == "__main__":
+    unittest.main()